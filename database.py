@@ -1,32 +1,142 @@
 """Database schema and helpers for UAT Test Management Tool."""
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 
 from flask import g
 
 # Result options for checklist items
 RESULTS = ("Pass", "Fail", "Partial", "NA")
+RESULTS_SET = frozenset(RESULTS)  # for membership checks; RESULTS keeps display order
 
 # Review status: draft, in_progress, completed, approved, rejected
 # archived (0=Active, 1=Archived) is separate from status
 REVIEW_STATUSES = ("draft", "in_progress", "completed", "approved", "rejected")
+REVIEW_STATUSES_SET = frozenset(REVIEW_STATUSES)
+
+# SQLite tuning applied to every connection: WAL lets readers run alongside a writer, NORMAL sync
+# skips the per-commit fsync of the main DB file (still durable in WAL mode), bigger page cache
+# (up to ~64 MB, allocated as pages are read), and reads through a memory map of up to 128 MB of the file instead of read() syscalls.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    " PRAGMA synchronous=NORMAL;"
+    " PRAGMA temp_store=MEMORY;"
+    " PRAGMA cache_size=-64000;"
+    " PRAGMA mmap_size=134217728;"
+)
+# Request connections also wait for a competing writer instead of failing with "database is locked"
+REQUEST_PRAGMAS = PRAGMAS + " PRAGMA busy_timeout=5000;"
+
+# Stamped into PRAGMA user_version once init_db has brought a database up to date.
+# Bump whenever init_db gains a schema change or migration.
+SCHEMA_VERSION = 11
+
+# Warm request connections kept per database path and reused across requests, so each request skips
+# connect + PRAGMA setup and keeps SQLite's page cache. LIFO hands out the most recently used connection.
+POOL_SIZE = 8
+# Prepared statements kept per connection (sqlite3 default is 128); pooled connections live across requests,
+# so the routes' fixed SQL strings stay prepared. Sized with headroom for the variable-length statements
+# (bulk_upsert_results chunks, IN lists per section count) so they don't evict the fixed ones.
+STATEMENT_CACHE_SIZE = 512
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(db_path):
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = queue.LifoQueue(maxsize=POOL_SIZE)
+        return pool
+
+
+def _make_conn(db_path):
+    """Open a request connection. check_same_thread is off because pooled connections move between
+    worker threads; each one is only ever used by one request at a time."""
+    conn = sqlite3.connect(
+        db_path,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.executescript(REQUEST_PRAGMAS)
+    return conn
+
+
+def open_db(db_path):
+    """Open a standalone connection with the request settings, for work outside a request (background jobs).
+    The caller closes it."""
+    return _make_conn(db_path)
 
 
 def get_db():
     """Get a database connection for the current request. Requires Flask app context with DATABASE config."""
     if "db" not in g:
         from flask import current_app
-        db_path = current_app.config.get("DATABASE", str(Path(__file__).parent / "uat.db"))
-        g.db = sqlite3.connect(str(db_path), detect_types=sqlite3.PARSE_DECLTYPES)
-        g.db.row_factory = sqlite3.Row
+        db_path = str(current_app.config.get("DATABASE", str(Path(__file__).parent / "uat.db")))
+        try:
+            g.db = _get_pool(db_path).get_nowait()
+        except queue.Empty:
+            g.db = _make_conn(db_path)
+        g.db_path = db_path
     return g.db
 
 
 def close_db(e=None):
-    """Close the database connection at end of request."""
+    """Return the request's connection to the pool at end of request (closed instead if the pool is full)."""
     db = g.pop("db", None)
+    db_path = g.pop("db_path", None)
     if db is not None:
-        db.close()
+        # Never hand an uncommitted transaction to the next request
+        if db.in_transaction:
+            db.rollback()
+        try:
+            _get_pool(db_path).put_nowait(db)
+        except queue.Full:
+            db.close()
+
+
+def iter_tuples(db, sql, params=()):
+    """Run a SELECT and return its cursor yielding plain tuples, bypassing the connection's sqlite3.Row factory.
+
+    For hot bulk reads that unpack columns by position; Row construction costs more per row than a tuple.
+    Rows are produced as the cursor is iterated (once), so callers never hold a fetchall() list.
+    """
+    cur = db.cursor()
+    cur.row_factory = None
+    return cur.execute(sql, params)
+
+
+# Rows per multi-VALUES INSERT in bulk_upsert_results (4 bound parameters each, well under SQLite's limit)
+BULK_CHUNK_SIZE = 100
+
+
+def bulk_upsert_results(db, review_id, rows):
+    """Upsert many review_result rows for one review in a single transaction.
+
+    rows: iterable of (checklist_id, result, attachment). Each statement carries up to BULK_CHUNK_SIZE
+    rows. A None result keeps the stored result (attachment-only update); attachment is always replaced.
+    The review's revision is bumped once for the whole save rather than by a per-row trigger.
+    """
+    rows = list(rows)
+    with db:
+        db.execute("UPDATE review SET revision = revision + 1 WHERE id = ?", (review_id,))
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_CHUNK_SIZE]
+            sql = (
+                "INSERT INTO review_result (review_id, checklist_id, result, attachment) VALUES "
+                + ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+                + " ON CONFLICT(review_id, checklist_id) DO UPDATE SET"
+                " result = COALESCE(excluded.result, review_result.result), attachment = excluded.attachment"
+            )
+            params = [
+                value
+                for checklist_id, result, attachment in chunk
+                for value in (review_id, checklist_id, result, attachment)
+            ]
+            db.execute(sql, params)
 
 
 def init_db(app=None):
@@ -38,6 +148,12 @@ def init_db(app=None):
     db_path = str(db_path)
 
     conn = sqlite3.connect(db_path)
+    conn.executescript(PRAGMAS)
+
+    # Fast path: schema already current, skip all introspection and migrations
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        conn.close()
+        return
 
     # Migration: add archived column and 'rejected' status (existing DBs created before this change).
     # Run this BEFORE the main script so an old review table gets the column before any CREATE INDEX on archived.
@@ -48,35 +164,37 @@ def init_db(app=None):
         cur = conn.execute("PRAGMA table_info(review)")
         cols = [row[1] for row in cur.fetchall()]
         if "archived" not in cols:
-            conn.execute(
-                """
-                CREATE TABLE review_new (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    app_name TEXT NOT NULL,
-                    app_id TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    app_owner_email TEXT NOT NULL DEFAULT '',
-                    overall_notes TEXT DEFAULT '',
-                    status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'in_progress', 'completed', 'approved', 'rejected')),
-                    archived INTEGER NOT NULL DEFAULT 0,
-                    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+            # One explicit transaction (a single commit) for the whole rebuild instead of autocommitting each DDL
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    """
+                    CREATE TABLE review_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        app_name TEXT NOT NULL,
+                        app_id TEXT NOT NULL,
+                        date TEXT NOT NULL,
+                        app_owner_email TEXT NOT NULL DEFAULT '',
+                        overall_notes TEXT DEFAULT '',
+                        status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'in_progress', 'completed', 'approved', 'rejected')),
+                        archived INTEGER NOT NULL DEFAULT 0,
+                        created_at TEXT NOT NULL DEFAULT (datetime('now'))
+                    )
+                    """
                 )
-                """
-            )
-            conn.execute(
-                """
-                INSERT INTO review_new (id, app_name, app_id, date, app_owner_email, overall_notes, status, archived, created_at)
-                SELECT id, app_name, app_id, date, app_owner_email, overall_notes, status,
-                       CASE WHEN status = 'approved' THEN 1 ELSE 0 END, created_at
-                FROM review
-                """
-            )
-            conn.execute("DROP TABLE review")
-            conn.execute("ALTER TABLE review_new RENAME TO review")
-            conn.execute("CREATE INDEX idx_review_status ON review (status)")
-            conn.execute("CREATE INDEX idx_review_created ON review (created_at)")
-            conn.execute("CREATE INDEX idx_review_archived ON review (archived)")
-            conn.commit()
+                conn.execute(
+                    """
+                    INSERT INTO review_new (id, app_name, app_id, date, app_owner_email, overall_notes, status, archived, created_at)
+                    SELECT id, app_name, app_id, date, app_owner_email, overall_notes, status,
+                           CASE WHEN status = 'approved' THEN 1 ELSE 0 END, created_at
+                    FROM review
+                    """
+                )
+                conn.execute("DROP TABLE review")
+                conn.execute("ALTER TABLE review_new RENAME TO review")
+                conn.execute("CREATE INDEX idx_review_status ON review (status)")
+                conn.execute("CREATE INDEX idx_review_created ON review (created_at)")
+                conn.execute("CREATE INDEX idx_review_archived ON review (archived)")
 
     conn.executescript(
         """
@@ -104,7 +222,8 @@ def init_db(app=None):
             overall_notes TEXT DEFAULT '',
             status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'in_progress', 'completed', 'approved', 'rejected')),
             archived INTEGER NOT NULL DEFAULT 0,
-            created_at TEXT NOT NULL DEFAULT (datetime('now'))
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            revision INTEGER NOT NULL DEFAULT 0
         );
 
         CREATE TABLE IF NOT EXISTS review_section (
@@ -124,18 +243,149 @@ def init_db(app=None):
             UNIQUE (review_id, checklist_id)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_review_result_review ON review_result (review_id);
+        -- Per-review progress counts for the runs overview, kept current by the triggers below so listing
+        -- reviews needs no aggregation over review_result
+        CREATE TABLE IF NOT EXISTS review_summary (
+            review_id INTEGER PRIMARY KEY,
+            filled INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_insert AFTER INSERT ON review_result
+        BEGIN
+            INSERT INTO review_summary (review_id, filled, total) VALUES (NEW.review_id, NEW.result IS NOT NULL, 1)
+            ON CONFLICT (review_id) DO UPDATE SET filled = filled + excluded.filled, total = total + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_update AFTER UPDATE OF result ON review_result
+        BEGIN
+            UPDATE review_summary SET filled = filled + (NEW.result IS NOT NULL) - (OLD.result IS NOT NULL)
+            WHERE review_id = NEW.review_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_delete AFTER DELETE ON review_result
+        BEGIN
+            UPDATE review_summary SET filled = filled - (OLD.result IS NOT NULL), total = total - 1
+            WHERE review_id = OLD.review_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_delete AFTER DELETE ON review
+        BEGIN
+            DELETE FROM review_summary WHERE review_id = OLD.id;
+        END;
+
+        -- Single-row counter bumped by the triggers below whenever what the runs overview shows may change (a
+        -- review row, its selected sections, or its result counts); the process-level cache of the overview keys
+        -- on it, so writes from any process or connection invalidate it. Result updates only count when they
+        -- fill or clear a result, as that is all the filled/total progress reflects.
+        CREATE TABLE IF NOT EXISTS reviews_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        INSERT OR IGNORE INTO reviews_version (id, version) VALUES (1, 0);
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_insert_reviews_version AFTER INSERT ON review
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        -- Only the columns the overview shows or filters on: run saves (header fields, revision bumps) don't count
+        DROP TRIGGER IF EXISTS trg_review_update_reviews_version;
+        CREATE TRIGGER IF NOT EXISTS trg_review_listing_update_reviews_version
+        AFTER UPDATE OF app_name, app_id, date, status, archived, created_at ON review
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_delete_reviews_version AFTER DELETE ON review
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_insert_reviews_version AFTER INSERT ON review_result
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_update_reviews_version AFTER UPDATE OF result ON review_result
+        WHEN (OLD.result IS NULL) != (NEW.result IS NULL)
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_result_delete_reviews_version AFTER DELETE ON review_result
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_section_insert_reviews_version AFTER INSERT ON review_section
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_section_delete_reviews_version AFTER DELETE ON review_section
+        BEGIN
+            UPDATE reviews_version SET version = version + 1;
+        END;
+
+        -- Single-row counter bumped by the triggers below on any change to the checklist or its sections;
+        -- process-level caches of the checklist key on it
+        CREATE TABLE IF NOT EXISTS checklist_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        INSERT OR IGNORE INTO checklist_version (id, version) VALUES (1, 0);
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_section_insert_version AFTER INSERT ON checklist_section
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_section_update_version AFTER UPDATE ON checklist_section
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_section_delete_version AFTER DELETE ON checklist_section
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_insert_version AFTER INSERT ON checklist
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_update_version AFTER UPDATE ON checklist
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_delete_version AFTER DELETE ON checklist
+        BEGIN
+            UPDATE checklist_version SET version = version + 1;
+        END;
+
         CREATE INDEX IF NOT EXISTS idx_review_result_checklist ON review_result (checklist_id);
         CREATE INDEX IF NOT EXISTS idx_review_status ON review (status);
         CREATE INDEX IF NOT EXISTS idx_review_created ON review (created_at);
-        CREATE INDEX IF NOT EXISTS idx_review_archived ON review (archived);
-        CREATE INDEX IF NOT EXISTS idx_checklist_section ON checklist (section_id);
-        CREATE INDEX IF NOT EXISTS idx_review_section_review ON review_section (review_id);
+        CREATE INDEX IF NOT EXISTS idx_review_archived_created ON review (archived, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_checklist_section_order ON checklist (section_id, sort_order);
         CREATE INDEX IF NOT EXISTS idx_review_section_section ON review_section (section_id);
         """
     )
     conn.commit()
 
+    # Migration: review_id lookups use the UNIQUE (review_id, checklist_id) index; drop the redundant single-column one
+    conn.execute("DROP INDEX IF EXISTS idx_review_result_review")
+    # Migration: (section_id, sort_order) serves section lookups and MAX(sort_order) per section; drop the old prefix index
+    conn.execute("DROP INDEX IF EXISTS idx_checklist_section")
+    # Migration: (archived, created_at) serves the per-tab listing; review_section's (review_id, section_id)
+    # primary key already serves review_id lookups
+    conn.execute("DROP INDEX IF EXISTS idx_review_archived")
+    conn.execute("DROP INDEX IF EXISTS idx_review_section_review")
+    conn.commit()
+
     # Migration: add is_default to checklist_section if missing (existing DBs)
     cur = conn.execute("PRAGMA table_info(checklist_section)")
     cols = [row[1] for row in cur.fetchall()]
@@ -157,23 +407,83 @@ def init_db(app=None):
         conn.execute("ALTER TABLE review ADD COLUMN store_url TEXT DEFAULT ''")
         conn.commit()
 
+    # Migration: add revision to review if missing. Bumped by the triggers below whenever the review or its sections
+    # change, and once per save by bulk_upsert_results (per-row triggers on review_result cost too much on bulk
+    # saves); the review pages use it in their ETag.
+    cur = conn.execute("PRAGMA table_info(review)")
+    cols = [row[1] for row in cur.fetchall()]
+    if "revision" not in cols:
+        conn.execute("ALTER TABLE review ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+        conn.commit()
+    conn.executescript(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_review_revision
+        AFTER UPDATE OF app_name, app_id, date, app_owner_email, store_url, overall_notes, status, archived ON review
+        BEGIN
+            UPDATE review SET revision = revision + 1 WHERE id = NEW.id;
+        END;
+
+        DROP TRIGGER IF EXISTS trg_review_result_insert_revision;
+        DROP TRIGGER IF EXISTS trg_review_result_update_revision;
+        DROP TRIGGER IF EXISTS trg_review_result_delete_revision;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_section_insert_revision AFTER INSERT ON review_section
+        BEGIN
+            UPDATE review SET revision = revision + 1 WHERE id = NEW.review_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_section_delete_revision AFTER DELETE ON review_section
+        BEGIN
+            UPDATE review SET revision = revision + 1 WHERE id = OLD.review_id;
+        END;
+        """
+    )
+
     # Migration: add section_id to checklist if missing (existing DBs)
     cur = conn.execute("PRAGMA table_info(checklist)")
     cols = [row[1] for row in cur.fetchall()]
     if "section_id" not in cols:
-        conn.execute("ALTER TABLE checklist ADD COLUMN section_id INTEGER REFERENCES checklist_section(id)")
-        conn.commit()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ALTER TABLE checklist ADD COLUMN section_id INTEGER REFERENCES checklist_section(id)")
+            conn.execute(
+                "INSERT INTO checklist_section (sort_order, name) VALUES (0, 'Section 1')"
+            )
+            default_sec = conn.execute("SELECT id FROM checklist_section ORDER BY sort_order, id LIMIT 1").fetchone()
+            if default_sec:
+                conn.execute("UPDATE checklist SET section_id = ? WHERE section_id IS NULL", (default_sec[0],))
+
+    # Deleting a section moves its items to the first remaining section (by sort order), so deleting the
+    # section row is all a caller does. With no other section the items keep their section_id.
+    conn.executescript(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_checklist_section_delete_reassign BEFORE DELETE ON checklist_section
+        BEGIN
+            UPDATE checklist SET section_id = COALESCE(
+                (SELECT id FROM checklist_section WHERE id != OLD.id ORDER BY sort_order, id LIMIT 1), OLD.id
+            )
+            WHERE section_id = OLD.id;
+        END;
+        """
+    )
+
+    # Migration: (re)build review_summary from review_result; the triggers keep it current from here on
+    with conn:
+        conn.execute("DELETE FROM review_summary")
         conn.execute(
-            "INSERT INTO checklist_section (sort_order, name) VALUES (0, 'Section 1')"
+            """
+            INSERT INTO review_summary (review_id, filled, total)
+            SELECT rr.review_id, SUM(rr.result IS NOT NULL), COUNT(*)
+            FROM review_result rr
+            JOIN review r ON r.id = rr.review_id
+            GROUP BY rr.review_id
+            """
         )
-        conn.commit()
-        default_sec = conn.execute("SELECT id FROM checklist_section ORDER BY sort_order, id LIMIT 1").fetchone()
-        if default_sec:
-            conn.execute("UPDATE checklist SET section_id = ? WHERE section_id IS NULL", (default_sec[0],))
-            conn.commit()
 
     # Ensure at least one section exists (new DBs)
     if conn.execute("SELECT COUNT(*) FROM checklist_section").fetchone()[0] == 0:
         conn.execute("INSERT INTO checklist_section (sort_order, name) VALUES (0, 'Section 1')")
         conn.commit()
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.close()
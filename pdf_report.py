@@ -1,16 +1,24 @@
 """Generate PDF report for a UAT review. Compact, modern layout with BC branding."""
+import copy
 import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from xml.sax.saxutils import escape
 
+from reportlab import rl_config
+from reportlab.graphics import renderPDF, renderPM
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     BaseDocTemplate,
     Flowable,
     Frame,
+    Image,
     PageTemplate,
     Paragraph,
     Spacer,
@@ -18,9 +26,63 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:  # svglib missing: reports are built without the logo
+    svg2rlg = None
+
 # Logo path: project assets folder
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOGO_PATH = os.path.join(_SCRIPT_DIR, "assets", "BigCommerce-logo-dark.svg")
+# Header logo box (~2.2" wide, ~1.3" tall by aspect); rasterized at print resolution
+LOGO_WIDTH_INCH = 2.4
+LOGO_HEIGHT_INCH = 1.35
+LOGO_RASTER_DPI = 300
+# Set PDF_DEBUG=1 to keep ReportLab's graphics attribute validation (shapeChecking) on
+PDF_DEBUG = bool(os.environ.get("PDF_DEBUG"))
+# shapeChecking validates every attribute set on graphics objects (the SVG logo's Drawing when it is parsed or
+# used unrasterized). It is a process-wide ReportLab setting, so it is switched off once here, before the logo
+# loads, rather than toggled per build, where overlapping builds on different threads could race.
+if not PDF_DEBUG:
+    rl_config.shapeChecking = 0
+
+
+def _file_mtime(path):
+    """mtime of a regular file, or None if missing: one stat() for both the existence check and cache key."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime if stat.S_ISREG(st.st_mode) else None
+
+
+@lru_cache(maxsize=1)
+def _load_logo_drawing(path, mtime):
+    """Parse the SVG once per (path, mtime); callers must copy before mutating the Drawing."""
+    if svg2rlg is None:
+        return None
+    return svg2rlg(path)
+
+
+@lru_cache(maxsize=4)
+def _get_scaled_logo(path, mtime, width_inch, height_inch):
+    """Copy of the parsed SVG scaled to fit the box, built once per (path, mtime, size). Shared read-only."""
+    cached = _load_logo_drawing(path, mtime)
+    if not cached:
+        return None
+    # Deep-copy so scaling never touches the parsed Drawing used for rasterizing
+    drawing = copy.deepcopy(cached)
+    if getattr(drawing, "width", 0) and getattr(drawing, "height", 0):
+        # Scale to fit in box, preserving aspect ratio (points: 72 per inch)
+        target_w = width_inch * 72
+        target_h = height_inch * 72
+        orig_w = drawing.width
+        orig_h = drawing.height
+        scale = min(target_w / orig_w, target_h / orig_h)
+        drawing.scale(scale, scale)
+        drawing.width = orig_w * scale
+        drawing.height = orig_h * scale
+    return drawing
 
 
 class SVGFlowable(Flowable):
@@ -32,20 +94,9 @@ class SVGFlowable(Flowable):
         self.height_inch = height_inch
         self.drawing = None
         try:
-            from svglib.svglib import svg2rlg
-
-            if os.path.isfile(path):
-                self.drawing = svg2rlg(path)
-                if self.drawing and getattr(self.drawing, "width", 0) and getattr(self.drawing, "height", 0):
-                    # Scale to fit in box, preserving aspect ratio (points: 72 per inch)
-                    target_w = width_inch * 72
-                    target_h = height_inch * 72
-                    orig_w = self.drawing.width
-                    orig_h = self.drawing.height
-                    scale = min(target_w / orig_w, target_h / orig_h)
-                    self.drawing.scale(scale, scale)
-                    self.drawing.width = orig_w * scale
-                    self.drawing.height = orig_h * scale
+            mtime = _file_mtime(path)
+            if mtime is not None:
+                self.drawing = _get_scaled_logo(path, mtime, width_inch, height_inch)
         except Exception:
             pass
 
@@ -56,17 +107,53 @@ class SVGFlowable(Flowable):
         if not self.drawing:
             return
         try:
-            from reportlab.graphics import renderPDF
-
             renderPDF.draw(self.drawing, self.canv, 0, 0)
         except Exception:
             pass
 
 
+def _rasterize_logo(path, width_inch, height_inch, dpi):
+    """Render the SVG logo to PNG once, scaled to fit the box. Returns (png_bytes, width_pt, height_pt) or None.
+
+    None when the file is missing or no renderPM backend (rlPyCairo / rl_renderPM) is installed.
+    """
+    try:
+        mtime = _file_mtime(path)
+        if mtime is None:
+            return None
+        drawing = _load_logo_drawing(path, mtime)
+        if not drawing or not getattr(drawing, "width", 0) or not getattr(drawing, "height", 0):
+            return None
+        scale = min(width_inch * 72 / drawing.width, height_inch * 72 / drawing.height)
+        # Rendering the unscaled drawing at dpi * scale yields `dpi` pixels per inch at the display size
+        png = renderPM.drawToString(drawing, fmt="PNG", dpi=dpi * scale)
+        return png, drawing.width * scale, drawing.height * scale
+    except Exception:
+        return None
+
+
+# Rasterized once at import so each report embeds a single image XObject instead of replaying vector ops
+_LOGO_RASTER = _rasterize_logo(LOGO_PATH, LOGO_WIDTH_INCH, LOGO_HEIGHT_INCH, LOGO_RASTER_DPI)
+# One ImageReader shared by every report: the PNG is decoded once and its pixel data cached
+_LOGO_READER = ImageReader(BytesIO(_LOGO_RASTER[0])) if _LOGO_RASTER else None
+
+
+class _ReaderImage(Image):
+    """Platypus Image drawn from an existing ImageReader (Image itself only accepts files/streams)."""
+
+    def __init__(self, reader, width, height):
+        # Set before Image.__init__ sizes the image, so it never opens a reader of its own
+        self._img = reader
+        Image.__init__(self, BytesIO(), width=width, height=height)
+
+
 def _logo_flowable():
-    if os.path.isfile(LOGO_PATH):
-        # Larger logo to match header prominence (~2.2" wide, ~1.3" tall by aspect)
-        return SVGFlowable(LOGO_PATH, width_inch=2.4, height_inch=1.35)
+    if _LOGO_READER:
+        _, width, height = _LOGO_RASTER
+        return _ReaderImage(_LOGO_READER, width, height)
+    if svg2rlg is not None and os.path.isfile(LOGO_PATH):
+        # Fallback when rasterization is unavailable: vector replay of the SVG
+        return SVGFlowable(LOGO_PATH, width_inch=LOGO_WIDTH_INCH, height_inch=LOGO_HEIGHT_INCH)
     return None
 
 
@@ -77,48 +164,415 @@ RESULT_CONFIG = {
     "Partial": ("Partial", colors.HexColor("#b86f00")),
     "NA": ("N/A", colors.HexColor("#666666")),
 }
-
-
-def _footer_canvas(canvas, doc, title=None):
-    """Draw PDF metadata (title), confidentiality notice, and page number on each page."""
+# Fixed result order for per-result buckets and summary counts; (display, color) in the same order
+_RESULT_KEYS = ("Pass", "Fail", "Partial", "NA")
+_RESULT_DISPLAY = tuple(RESULT_CONFIG[k] for k in _RESULT_KEYS)
+# Single lookup per row: result key -> (index, display text, color)
+_RESULT_META = {k: (i,) + RESULT_CONFIG[k] for i, k in enumerate(_RESULT_KEYS)}
+
+# Colors parsed once at import (HexColor parses its string on every call)
+TABLE_HEADER_BG = colors.HexColor("#34313F")
+GRID_COLOR = colors.HexColor("#ddd")
+HEADER_SEPARATOR_COLOR = colors.HexColor("#ccc")
+FOOTER_LINE_COLOR = colors.HexColor("#888")
+FOOTER_TEXT_COLOR = colors.HexColor("#333")
+# Alternating row color for data rows (light gray); section rows a shade darker
+ROW_ALT_BG = colors.HexColor("#E8E8EC")
+SECTION_ROW_BG = colors.HexColor("#D3D1DB")
+LINK_COLOR = colors.HexColor("#3C64F4")  # reference links (inline markup in Paragraph cells uses the same hex)
+
+
+# Position footer well above bottom edge so it stays visible (not clipped by viewers/printers)
+FOOTER_Y = 0.6 * inch
+FOOTER_FONT_SIZE = 9
+_FOOTER_FORM = "reportFooter"
+
+
+def _footer_canvas(canvas, doc):
+    """Draw the confidentiality notice and page number on each page.
+
+    The rule and notice are page-invariant: they are recorded once per document as a Form XObject and
+    placed on each page with doForm, so only the page number is drawn per page.
+    """
     canvas.saveState()
-    # Set document title so viewers don't show "(anonymous)"
-    if title:
-        canvas.setTitle(title)
-    # Position footer well above bottom edge so it stays visible (not clipped by viewers/printers)
-    footer_y = 0.6 * inch
-    footer_font_size = 9
-    line_y = footer_y + (footer_font_size * 0.6)
-    canvas.setStrokeColor(colors.HexColor("#888"))
-    canvas.setLineWidth(0.5)
-    canvas.line(0.5 * inch, line_y, 8 * inch, line_y)
-    canvas.setFont("Helvetica-Bold", footer_font_size)
-    canvas.setFillColor(colors.HexColor("#333"))
-    canvas.drawString(0.5 * inch, footer_y, "Confidential \u2014 Not for public release.")
-    canvas.drawRightString(8 * inch, footer_y, f"Page {doc.page}")
+    if not getattr(doc, "_footer_form_done", False):
+        line_y = FOOTER_Y + (FOOTER_FONT_SIZE * 0.6)
+        canvas.beginForm(_FOOTER_FORM)
+        canvas.setStrokeColor(FOOTER_LINE_COLOR)
+        canvas.setLineWidth(0.5)
+        canvas.line(0.5 * inch, line_y, 8 * inch, line_y)
+        canvas.setFont("Helvetica-Bold", FOOTER_FONT_SIZE)
+        canvas.setFillColor(FOOTER_TEXT_COLOR)
+        canvas.drawString(0.5 * inch, FOOTER_Y, "Confidential \u2014 Not for public release.")
+        canvas.endForm()
+        doc._footer_form_done = True
+    canvas.doForm(_FOOTER_FORM)
+    canvas.setFont("Helvetica-Bold", FOOTER_FONT_SIZE)
+    canvas.setFillColor(FOOTER_TEXT_COLOR)
+    canvas.drawRightString(8 * inch, FOOTER_Y, f"Page {doc.page}")
     canvas.restoreState()
 
 
+# Compact styles: smaller fonts for more content per page. Built once at import and shared by every
+# report; treat them as read-only (derive a new ParagraphStyle rather than assigning attributes).
+_STYLES = getSampleStyleSheet()
+HEADER_TITLE_STYLE = ParagraphStyle(
+    "HeaderTitle",
+    parent=_STYLES["Normal"],
+    fontName="Helvetica-Bold",
+    fontSize=9,
+    spaceBefore=0,
+    spaceAfter=0,
+    textColor=colors.HexColor("#333"),
+)
+HEADER_META_STYLE = ParagraphStyle(
+    "HeaderMeta",
+    parent=_STYLES["Normal"],
+    fontSize=8,
+    textColor=colors.HexColor("#444"),
+    leading=11,
+)
+BODY_STYLE = ParagraphStyle(
+    "Body",
+    parent=_STYLES["Normal"],
+    fontSize=7,
+)
+TABLE_CELL_STYLE = ParagraphStyle(
+    "TableCell",
+    parent=_STYLES["Normal"],
+    fontSize=7,
+    leading=8,
+    spaceBefore=0,
+    spaceAfter=0,
+)
+
+REF_MAX_LEN = 50
+# References starting with these become links (one str.startswith call with a tuple)
+_URL_PREFIXES = ("https://", "http://")
+
+
+# Static part of the criteria table style (header row, fonts, padding, grid); per-row commands are appended per report
+_CRITERIA_TABLE_STYLE = (
+    ("BACKGROUND", (0, 0), (-1, 0), TABLE_HEADER_BG),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 7),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ("GRID", (0, 0), (-1, -1), 0.25, GRID_COLOR),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),  # center text vertically in each row
+    ("LINEBELOW", (0, 0), (-1, 0), 0.5, TABLE_HEADER_BG),
+)
+
+
+# Single-pass markup escaping (one str.translate instead of chained replaces); quotes too, for href attributes
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+@lru_cache(maxsize=4096)
+def _escaped(text):
+    """Markup-escaped text for a Paragraph, memoized: criterion texts and references repeat across reports.
+
+    Paragraph objects themselves are not cached; they keep per-layout state once wrapped or split.
+    """
+    return text.translate(_XML_ESCAPE)
+
+
+def _text_cell(text, width, style):
+    """Table cell for plain text: the raw string when it fits on one line, else a wrapping Paragraph.
+
+    Keep this fast path: a bare string is drawn directly by Table, while each Paragraph costs a markup
+    parse plus wrap (10-100x more). Only text that needs wrapping pays for a Paragraph.
+    """
+    if "\n" not in text and stringWidth(text, style.fontName, style.fontSize) <= width:
+        return text
+    return Paragraph(_escaped(text), style)
+
+
+def _contiguous_runs(rows):
+    """Collapse ascending row indexes into (start, end) ranges of consecutive rows."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
+
+
+# Data rows per criteria Table. Platypus re-measures every remaining row each time it splits a table across
+# a page, so one huge table costs O(rows x pages); capped tables keep long reports linear.
+CRITERIA_TABLE_MAX_ROWS = 100
+
+
+def _criteria_chunks(sections_criteria, max_rows):
+    """Yield the criteria table rows as lists of (number, shaded, item) entries, one list per Table.
+
+    A section row is (None, False, section_name). Numbering runs across sections; stripes (shaded) restart
+    in each section on its first, third, ... criterion. Cuts prefer section boundaries, where the repeated
+    column header reads naturally: at a section start once a list holds max_rows // 2 entries, mid-section
+    only at max_rows, and never between a section row and its first criterion.
+    """
+    chunk = []
+    number = 1
+    for section in sections_criteria:
+        if len(chunk) >= max_rows // 2:
+            yield chunk
+            chunk = []
+        chunk.append((None, False, section.get("name", "General")))
+        for i, c in enumerate(section.get("items", [])):
+            if i and len(chunk) >= max_rows:
+                yield chunk
+                chunk = []
+            chunk.append((number, i % 2 == 0, c))
+            number += 1
+    if chunk:
+        yield chunk
+
+
+# Criteria count above which the criteria are drawn by CriteriaRowsFlowable instead of Platypus Tables
+CRITERIA_LOWLEVEL_MIN_ROWS = 1000
+# CriteriaRowsFlowable metrics, matching _CRITERIA_TABLE_STYLE: bare-string cells keep the Table default
+# leading of 12, wrapped text uses TABLE_CELL_STYLE's leading of 8
+_LL_FONT_SIZE = 7
+_LL_LEADING = 8
+_LL_MIN_LINE_HEIGHT = 12
+_LL_PAD_X = 4
+_LL_PAD_Y = 3
+_LL_HEADER_HEIGHT = _LL_MIN_LINE_HEIGHT + 2 * _LL_PAD_Y
+_LL_SECTION_HEIGHT = _LL_MIN_LINE_HEIGHT + 5 + _LL_PAD_Y  # TOPPADDING 5 on section rows
+
+
+def _wrap_lines(text, width, font_name, font_size):
+    """Split text into lines that fit width, breaking overlong words (e.g. URLs) by character."""
+    lines = []
+    for line in simpleSplit(text, font_name, font_size, width) or [""]:
+        while stringWidth(line, font_name, font_size) > width and len(line) > 1:
+            cut = len(line) - 1
+            while cut > 1 and stringWidth(line[:cut], font_name, font_size) > width:
+                cut -= 1
+            lines.append(line[:cut])
+            line = line[cut:]
+        lines.append(line)
+    return lines
+
+
+class CriteriaRowsFlowable(Flowable):
+    """Criteria rows drawn straight onto the canvas, for reports too long for Platypus Table.
+
+    Same columns, colors and paddings as the Table layout, without per-cell Paragraph/wrap/split work: text
+    is pre-wrapped with simpleSplit and the flowable splits between rows, repeating the column header on
+    each page. rows are ("section", height, name) or ("item", height, cells); see _criteria_rows_flowable.
+    """
+
+    def __init__(self, rows, col_widths):
+        Flowable.__init__(self)
+        self.hAlign = "CENTER"  # as Table: centered in the frame (it is wider than the padded frame)
+        self.rows = rows
+        self.col_widths = col_widths
+        self.width = sum(col_widths)
+        self.height = _LL_HEADER_HEIGHT + sum(row[1] for row in rows)
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        used = _LL_HEADER_HEIGHT
+        count = 0
+        for _, height, _ in self.rows:
+            if used + height > availHeight:
+                break
+            used += height
+            count += 1
+        # Keep a section name on the same page as its first criterion
+        if 0 < count < len(self.rows) and self.rows[count - 1][0] == "section":
+            count -= 1
+        if count == 0:
+            return []
+        return [
+            CriteriaRowsFlowable(self.rows[:count], self.col_widths),
+            CriteriaRowsFlowable(self.rows[count:], self.col_widths),
+        ]
+
+    def _draw_lines(self, lines, x, mid):
+        """Draw lines vertically centered on mid (TABLE_CELL_STYLE leading for wrapped text)."""
+        canv = self.canv
+        leading = _LL_LEADING if len(lines) > 1 else _LL_MIN_LINE_HEIGHT
+        baseline = mid + len(lines) * leading / 2 - leading + (leading - _LL_FONT_SIZE) / 2 + 1
+        for line in lines:
+            canv.drawString(x, baseline, line)
+            baseline -= leading
+
+    def draw(self):
+        canv = self.canv
+        width = self.width
+        edges = [0]
+        for col_width in self.col_widths:
+            edges.append(edges[-1] + col_width)
+        y = self.height
+
+        canv.setFillColor(TABLE_HEADER_BG)
+        canv.rect(0, y - _LL_HEADER_HEIGHT, width, _LL_HEADER_HEIGHT, stroke=0, fill=1)
+        canv.setFillColor(colors.white)
+        canv.setFont("Helvetica-Bold", _LL_FONT_SIZE)
+        for x, label in zip(edges, ("#", "Criterion", "Result", "Reference")):
+            self._draw_lines([label], x + _LL_PAD_X, y - _LL_HEADER_HEIGHT / 2)
+        y -= _LL_HEADER_HEIGHT
+        header_bottom = y
+
+        grid = []  # (x1, y1, x2, y2) grid lines, stroked together at the end
+        for kind, height, cells in self.rows:
+            bottom = y - height
+            if kind == "section":
+                canv.setFillColor(SECTION_ROW_BG)
+                canv.rect(0, bottom, width, height, stroke=0, fill=1)
+                canv.setFillColor(colors.black)
+                canv.setFont("Helvetica-Bold", 8)
+                # TOPPADDING 5 / BOTTOMPADDING 3: text sits a point below the row's middle
+                self._draw_lines([cells], _LL_PAD_X, bottom + height / 2 - 1)
+            else:
+                number, criterion_lines, result_text, result_color, ref_lines, ref_url, shaded = cells
+                mid = bottom + height / 2
+                if shaded:
+                    canv.setFillColor(ROW_ALT_BG)
+                    canv.rect(0, bottom, width, height, stroke=0, fill=1)
+                canv.setFont("Helvetica", _LL_FONT_SIZE)
+                canv.setFillColor(colors.black)
+                self._draw_lines([number], edges[0] + _LL_PAD_X, mid)
+                self._draw_lines(criterion_lines, edges[1] + _LL_PAD_X, mid)
+                canv.setFillColor(result_color)
+                self._draw_lines([result_text], edges[2] + _LL_PAD_X, mid)
+                if ref_url:
+                    canv.setFillColor(LINK_COLOR)
+                    canv.linkURL(ref_url, (edges[3], bottom, edges[4], y), relative=1)
+                else:
+                    canv.setFillColor(colors.black)
+                self._draw_lines(ref_lines, edges[3] + _LL_PAD_X, mid)
+                grid.extend((x, bottom, x, y) for x in edges[1:4])
+            grid.append((0, bottom, width, bottom))
+            y = bottom
+
+        canv.setStrokeColor(GRID_COLOR)
+        canv.setLineWidth(0.25)
+        grid.append((0, 0, 0, self.height))
+        grid.append((width, 0, width, self.height))
+        grid.extend((x, header_bottom, x, self.height) for x in edges[1:4])
+        canv.lines(grid)
+        canv.setStrokeColor(TABLE_HEADER_BG)
+        canv.setLineWidth(0.5)
+        canv.line(0, header_bottom, width, header_bottom)
+
+
+def _criteria_rows_flowable(entries, col_widths, counts):
+    """CriteriaRowsFlowable for one _criteria_chunks list; adds each criterion's result to counts."""
+    criterion_width = col_widths[1] - 2 * _LL_PAD_X
+    ref_width = col_widths[3] - 2 * _LL_PAD_X
+    result_meta_get = _RESULT_META.get
+    rows = []
+    for number, shaded, c in entries:
+        if number is None:
+            rows.append(("section", _LL_SECTION_HEIGHT, c))
+            continue
+        meta = result_meta_get(c.get("result"))
+        if meta:
+            result_idx, result_text, result_color = meta
+            counts[result_idx] += 1
+        else:
+            result_text, result_color = "—", colors.black
+        criterion_lines = _wrap_lines(c.get("text", ""), criterion_width, "Helvetica", _LL_FONT_SIZE)
+        attachment = (c.get("attachment") or "").strip()
+        if attachment:
+            ref_display = attachment if len(attachment) <= REF_MAX_LEN else attachment[:REF_MAX_LEN - 3] + "..."
+            ref_lines = _wrap_lines(ref_display, ref_width, "Helvetica", _LL_FONT_SIZE)
+            ref_url = attachment if attachment.startswith(_URL_PREFIXES) else None
+        else:
+            ref_lines, ref_url = ["—"], None
+        line_count = max(len(criterion_lines), len(ref_lines))
+        height = (_LL_LEADING * line_count if line_count > 1 else _LL_MIN_LINE_HEIGHT) + 2 * _LL_PAD_Y
+        rows.append((
+            "item",
+            max(height, _LL_MIN_LINE_HEIGHT + 2 * _LL_PAD_Y),
+            (str(number), criterion_lines, result_text, result_color, ref_lines, ref_url, shaded),
+        ))
+    return CriteriaRowsFlowable(rows, col_widths)
+
+
 # Minimum gap between logo and title when title is below logo (20px ≈ 20pt at 72 dpi)
 HEADER_TITLE_GAP_BELOW_LOGO = 20 / 72 * inch  # 20pt minimum
 
 
-def build_pdf(review, sections_criteria, header_title_position="right_top"):
-    """Build a PDF report for the given review and criteria grouped by section. Returns BytesIO buffer.
+# Header table styles; only the paragraphs change per report
+_HEADER_STYLE_WITH_LOGO = TableStyle([
+    ("VALIGN", (0, 0), (0, 0), "TOP"),
+    ("VALIGN", (1, 0), (1, 0), "MIDDLE"),
+    ("LEFTPADDING", (0, 0), (0, -1), 0),
+    ("RIGHTPADDING", (0, 0), (0, -1), 8),
+    ("LEFTPADDING", (1, 0), (1, -1), 12),
+    ("RIGHTPADDING", (1, 0), (1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ("LINEBEFORE", (1, 0), (1, -1), 0.5, HEADER_SEPARATOR_COLOR),  # vertical separator
+])
+_HEADER_STYLE_NO_LOGO = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ("LINEBEFORE", (1, 0), (1, -1), 0.5, HEADER_SEPARATOR_COLOR),
+])
+
+
+def _make_header_table(logo, title_para, meta_para, title_position, content_width):
+    """Header: left = logo + title stacked; right = metadata block; vertical separator.
+
+    title_position: "right_top" = title at top of right column, block vertically centered;
+                    "below_logo" = title directly below logo (min 20pt gap). Without a logo the title
+                    simply takes the left column.
+    """
+    logo_col = 2.5 * inch
+    col_widths = [logo_col, content_width - logo_col]
+    if not logo:
+        table = Table([[title_para, meta_para]], colWidths=col_widths)
+        table.setStyle(_HEADER_STYLE_NO_LOGO)
+        return table
+    if title_position == "right_top":
+        # Left column: logo only. Right column: title at top, then metadata block; vertically centered.
+        left_content = [logo]
+        right_content = [title_para, Spacer(1, 0.12 * inch), meta_para]
+    else:
+        # below_logo: title directly below logo with minimum 20pt gap
+        left_content = [logo, Spacer(1, HEADER_TITLE_GAP_BELOW_LOGO), title_para]
+        right_content = meta_para
+    table = Table([[left_content, right_content]], colWidths=col_widths)
+    table.setStyle(_HEADER_STYLE_WITH_LOGO)
+    return table
+
+
+def build_pdf(review, sections_criteria, out=None, header_title_position="right_top"):
+    """Build a PDF report for the given review and criteria grouped by section.
 
+    out: writable binary file-like to build into (e.g. a SpooledTemporaryFile, so large reports need not
+         sit in RAM); a new BytesIO is used when omitted. Returns the stream written to.
     header_title_position: "right_top" = title at top of right column, block vertically centered;
                           "below_logo" = title directly below logo (min 20pt gap).
     """
-    buf = BytesIO()
+    if out is None:
+        out = BytesIO()
     margin = 0.5 * inch
     bottom_with_footer = 0.9 * inch  # room for footer so it's not clipped
+    app_name = (review.get("app_name") or "Report").strip()
     doc = BaseDocTemplate(
-        buf,
+        out,
         pagesize=letter,
         rightMargin=margin,
         leftMargin=margin,
         topMargin=margin,
         bottomMargin=bottom_with_footer,
+        # Document title metadata, set once on the canvas so viewers don't show "(anonymous)"
+        title=f"Marketplace App Review Results \u2014 {app_name}",
     )
     frame = Frame(
         doc.leftMargin,
@@ -127,65 +581,11 @@ def build_pdf(review, sections_criteria, header_title_position="right_top"):
         doc.height,
         id="normal",
     )
-    app_name = (review.get("app_name") or "Report").strip()
-    pdf_title = f"Marketplace App Review Results \u2014 {app_name}"
-
-    def on_page(canvas, doc):
-        _footer_canvas(canvas, doc, title=pdf_title)
-
-    doc.addPageTemplates([PageTemplate(id="all", frames=frame, onPage=on_page)])
+    doc.addPageTemplates([PageTemplate(id="all", frames=frame, onPage=_footer_canvas)])
     # Content width on letter with 0.5" margins = 7.5"
     content_width = 7.5 * inch
-    styles = getSampleStyleSheet()
-
-    # Compact styles: smaller fonts for more content per page
-    header_title_style = ParagraphStyle(
-        "HeaderTitle",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=9,
-        spaceBefore=0,
-        spaceAfter=0,
-        textColor=colors.HexColor("#333"),
-    )
-    header_meta_style = ParagraphStyle(
-        "HeaderMeta",
-        parent=styles["Normal"],
-        fontSize=8,
-        textColor=colors.HexColor("#444"),
-        leading=11,
-    )
-    section_style = ParagraphStyle(
-        "Section",
-        parent=styles["Heading2"],
-        fontName="Helvetica-Bold",
-        fontSize=8,
-        spaceBefore=8,
-        spaceAfter=4,
-    )
-    body_style = ParagraphStyle(
-        "Body",
-        parent=styles["Normal"],
-        fontSize=7,
-    )
-    table_cell_style = ParagraphStyle(
-        "TableCell",
-        parent=styles["Normal"],
-        fontSize=7,
-        leading=8,
-        spaceBefore=0,
-        spaceAfter=0,
-    )
-
-    # Alternating row color for data rows (light gray)
-    ROW_ALT_BG = colors.HexColor("#E8E8EC")
-    REF_MAX_LEN = 50
 
-    def _truncate(s, max_len):
-        s = (s or "").strip()
-        if len(s) <= max_len:
-            return s
-        return s[: max_len - 3] + "..."
+    table_cell_style = TABLE_CELL_STYLE
 
     body = []
 
@@ -202,66 +602,13 @@ def build_pdf(review, sections_criteria, header_title_position="right_top"):
         f"Date: {date_val}<br/>"
         f"Submitter: {submitter_email}"
     )
-    logo = _logo_flowable()
-    logo_col = 2.5 * inch
-    meta_col = content_width - logo_col
-
-    if logo:
-        title_para = Paragraph("Marketplace App Review Results", header_title_style)
-        if header_title_position == "right_top":
-            # Left column: logo only. Right column: title at top, then metadata block; vertically centered.
-            left_content = [logo]
-            right_content = [
-                title_para,
-                Spacer(1, 0.12 * inch),
-                Paragraph(meta_block, header_meta_style),
-            ]
-            header_content = [[left_content, right_content]]
-            valign_right = "MIDDLE"
-        else:
-            # below_logo: title directly below logo with minimum 20pt gap
-            left_content = [
-                logo,
-                Spacer(1, HEADER_TITLE_GAP_BELOW_LOGO),
-                title_para,
-            ]
-            right_content = Paragraph(meta_block, header_meta_style)
-            header_content = [[left_content, right_content]]
-            valign_right = "MIDDLE"
-
-        header_table = Table(
-            header_content,
-            colWidths=[logo_col, meta_col],
-        )
-        header_table.setStyle(
-            TableStyle([
-                ("VALIGN", (0, 0), (0, 0), "TOP"),
-                ("VALIGN", (1, 0), (1, 0), valign_right),
-                ("LEFTPADDING", (0, 0), (0, -1), 0),
-                ("RIGHTPADDING", (0, 0), (0, -1), 8),
-                ("LEFTPADDING", (1, 0), (1, -1), 12),
-                ("RIGHTPADDING", (1, 0), (1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("LINEBEFORE", (1, 0), (1, -1), 0.5, colors.HexColor("#ccc")),  # vertical separator
-            ])
-        )
-    else:
-        header_content = [[
-            Paragraph("Marketplace App Review Results", header_title_style),
-            Paragraph(meta_block, header_meta_style),
-        ]]
-        header_table = Table(header_content, colWidths=[logo_col, meta_col])
-        header_table.setStyle(
-            TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("LINEBEFORE", (1, 0), (1, -1), 0.5, colors.HexColor("#ccc")),
-            ])
-        )
+    header_table = _make_header_table(
+        _logo_flowable(),
+        Paragraph("Marketplace App Review Results", HEADER_TITLE_STYLE),
+        Paragraph(meta_block, HEADER_META_STYLE),
+        header_title_position,
+        content_width,
+    )
     body.append(header_table)
     body.append(Spacer(1, 0.25 * inch))
 
@@ -270,77 +617,111 @@ def build_pdf(review, sections_criteria, header_title_position="right_top"):
     col_result = 0.65 * inch
     col_reference = 1.0 * inch
     col_criterion = content_width - col_num - col_result - col_reference
-
-    counts = {"Pass": 0, "Fail": 0, "Partial": 0, "NA": 0}
-    global_idx = 1
-    for section in sections_criteria:
-        body.append(Paragraph(section.get("name", "General"), section_style))
-        items = section.get("items", [])
-        table_data = [["#", "Criterion", "Result", "Reference"]]
-        result_styles = []  # (row_index, result_key) for color styling
-        for c in items:
-            raw_result = c.get("result") or ""
-            if raw_result in counts:
-                counts[raw_result] += 1
-            display_text, _ = RESULT_CONFIG.get(raw_result, ("—", colors.HexColor("#666666")))
-            criterion_text = c.get("text", "")
-            criterion_cell = Paragraph(escape(criterion_text), table_cell_style)
+    criterion_text_width = col_criterion - 8  # minus LEFTPADDING + RIGHTPADDING
+    ref_text_width = col_reference - 8
+
+    col_widths = [col_num, col_criterion, col_result, col_reference]
+    counts = [0] * len(_RESULT_KEYS)  # summary counts, in _RESULT_KEYS order
+    result_meta_get = _RESULT_META.get
+    # Very long reports skip Platypus Table (per-cell wrap and split work) for directly drawn rows
+    lowlevel = sum(len(section.get("items", [])) for section in sections_criteria) > CRITERIA_LOWLEVEL_MIN_ROWS
+    # Section names are spanned rows, so sections share tables; long reports become several tables
+    # of at most ~CRITERIA_TABLE_MAX_ROWS rows (see _criteria_chunks)
+    for entries in _criteria_chunks(sections_criteria, CRITERIA_TABLE_MAX_ROWS):
+        if lowlevel:
+            body.append(_criteria_rows_flowable(entries, col_widths, counts))
+            continue
+        chunk_rows = [["#", "Criterion", "Result", "Reference"]]
+        style_commands = list(_CRITERIA_TABLE_STYLE)
+        # Local aliases: skip attribute lookups in the per-criterion loop
+        append_row = chunk_rows.append
+        append_style = style_commands.append
+        # Table row indexes per result (ascending), in _RESULT_KEYS order
+        result_rows = tuple([] for _ in _RESULT_KEYS)
+        for number, shaded, c in entries:
+            row_idx = len(chunk_rows)
+            if number is None:
+                # Section row: c is the section name
+                append_row([c, "", "", ""])
+                style_commands.extend([
+                    ("SPAN", (0, row_idx), (-1, row_idx)),
+                    ("BACKGROUND", (0, row_idx), (-1, row_idx), SECTION_ROW_BG),
+                    ("FONTNAME", (0, row_idx), (-1, row_idx), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, row_idx), (-1, row_idx), 8),
+                    ("TOPPADDING", (0, row_idx), (-1, row_idx), 5),
+                    # Keep the section name on the same page as its first criterion
+                    ("NOSPLIT", (0, row_idx), (-1, row_idx + 1)),
+                ])
+                continue
+            meta = result_meta_get(c.get("result"))
+            if meta:
+                result_idx, display_text, _ = meta
+                result_rows[result_idx].append(row_idx)
+            else:
+                display_text = "—"
+            criterion_cell = _text_cell(c.get("text", ""), criterion_text_width, table_cell_style)
             attachment = (c.get("attachment") or "").strip()
             if attachment:
-                ref_display = _truncate(attachment, REF_MAX_LEN)
-                if attachment.startswith("https://") or attachment.startswith("http://"):
+                # attachment is already stripped and non-empty: truncate inline
+                if len(attachment) <= REF_MAX_LEN:
+                    ref_display = attachment
+                else:
+                    ref_display = attachment[:REF_MAX_LEN - 3] + "..."
+                if attachment.startswith(_URL_PREFIXES):
                     ref_cell = Paragraph(
-                        f'<a href="{escape(attachment)}" color="#3C64F4">{escape(ref_display)}</a>',
+                        f'<a href="{_escaped(attachment)}" color="#3C64F4">{_escaped(ref_display)}</a>',
                         table_cell_style,
                     )
                 else:
-                    ref_cell = Paragraph(escape(ref_display), table_cell_style)
+                    ref_cell = _text_cell(ref_display, ref_text_width, table_cell_style)
             else:
                 ref_cell = "—"
-            table_data.append([str(global_idx), criterion_cell, display_text, ref_cell])
-            result_styles.append((len(table_data) - 1, raw_result))
-            global_idx += 1
-        if table_data:
-            crit_table = Table(
-                table_data,
-                colWidths=[col_num, col_criterion, col_result, col_reference],
-                repeatRows=1,
-            )
-            style_commands = [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#34313F")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 7),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#ddd")),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),  # center text vertically in each row
-                ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.HexColor("#34313F")),
-            ]
-            for row_idx in range(1, len(table_data)):
-                if row_idx % 2 == 1:
-                    style_commands.append(
-                        ("BACKGROUND", (0, row_idx), (-1, row_idx), ROW_ALT_BG)
-                    )
-            for row_idx, result_key in result_styles:
-                if result_key in RESULT_CONFIG:
-                    _, color = RESULT_CONFIG[result_key]
-                    style_commands.append(("TEXTCOLOR", (2, row_idx), (2, row_idx), color))
-            crit_table.setStyle(TableStyle(style_commands))
-            body.append(crit_table)
+            append_row([str(number), criterion_cell, display_text, ref_cell])
+            # Kept per row: a ROWBACKGROUNDS range restarts its color cycle wherever Platypus splits the
+            # table across pages.
+            if shaded:
+                append_style(("BACKGROUND", (0, row_idx), (-1, row_idx), ROW_ALT_BG))
+        # One TEXTCOLOR command per run of consecutive rows sharing a result, not one per row
+        for result_idx, ((_, color), rows) in enumerate(zip(_RESULT_DISPLAY, result_rows)):
+            counts[result_idx] += len(rows)
+            for start, end in _contiguous_runs(rows):
+                append_style(("TEXTCOLOR", (2, start), (2, end), color))
+        crit_table = Table(chunk_rows, colWidths=col_widths, repeatRows=1)
+        crit_table.setStyle(TableStyle(style_commands))
+        body.append(crit_table)
     body.append(Spacer(1, 0.15 * inch))
 
     if review.get("overall_notes"):
-        body.append(Paragraph("<b>Overall notes:</b> " + review["overall_notes"], body_style))
+        body.append(Paragraph("<b>Overall notes:</b> " + review["overall_notes"], BODY_STYLE))
         body.append(Spacer(1, 0.1 * inch))
 
+    pass_count, fail_count, partial_count, na_count = counts
     summary = (
-        f"Summary: Pass {counts['Pass']}, Fail {counts['Fail']}, "
-        f"Partial {counts['Partial']}, N/A {counts['NA']}"
+        f"Summary: Pass {pass_count}, Fail {fail_count}, "
+        f"Partial {partial_count}, N/A {na_count}"
     )
-    body.append(Paragraph(summary, body_style))
+    body.append(Paragraph(summary, BODY_STYLE))
 
     doc.build(body)
-    return buf
+    return out
+
+
+def _warm_worker():
+    """Batch worker initializer: load the logo (SVG parse / scaled Drawing caches) once per process."""
+    _logo_flowable()
+
+
+def _build_pdf_bytes(job):
+    review, sections_criteria = job
+    return build_pdf(review, sections_criteria).getvalue()
+
+
+def build_pdfs_batch(reviews_and_criteria, workers=None):
+    """Build many reports in parallel worker processes (ReportLab layout is CPU-bound and holds the GIL).
+
+    reviews_and_criteria: iterable of (review, sections_criteria) pairs as passed to build_pdf; they are
+    pickled to the workers, so use plain dicts rather than sqlite3.Row. workers defaults to the CPU count.
+    Returns the PDFs as bytes, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+        return list(pool.map(_build_pdf_bytes, reviews_and_criteria))
@@ -1,89 +1,452 @@
 """Flask routes for UAT Test Management Tool."""
 import csv
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from io import BytesIO, StringIO, TextIOWrapper
+from functools import lru_cache
+from io import TextIOWrapper
+from itertools import groupby
+from operator import itemgetter
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from uuid import uuid4
 
 from flask import (
     abort,
     flash,
+    g,
+    jsonify,
+    make_response,
     redirect,
     render_template,
     request,
     send_file,
+    session,
     url_for,
 )
 
-from database import RESULTS, get_db
+from database import BULK_CHUNK_SIZE, RESULTS, RESULTS_SET, bulk_upsert_results, get_db, iter_tuples, open_db
+from pdf_report import build_pdf
+
+_log = logging.getLogger(__name__)
+
+# PDFs up to this size are built in memory; larger ones spill to a temp file instead of growing RAM
+PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
+# CSV uploads larger than this (request body bytes) are imported on a background thread
+CSV_ASYNC_MIN_BYTES = 1024 * 1024
+# One worker: imports write the checklist, so running them one at a time avoids contending for the write lock
+_import_executor = ThreadPoolExecutor(max_workers=1)
+# job_id -> {"status": "running" | "done" | "error", "message": str}. Finished jobs beyond IMPORT_JOBS_KEPT are
+# dropped oldest first; running jobs are never dropped. Each browser session lists its unreported jobs under
+# session["csv_import_jobs"], and checklist_edit flashes their results once they finish.
+_import_jobs = {}
+_import_jobs_lock = threading.Lock()
+IMPORT_JOBS_KEPT = 100
+
+# Hot queries as module constants: every route sends the identical string, so each pooled connection's
+# statement cache keeps one prepared statement per query instead of re-preparing per request.
+# One tab of the runs overview (bind: archived); the "filled/total (pct%)" progress label ("—" with no items) is
+# built in SQL from the review_summary counts
+INDEX_SQL = """
+    SELECT r.id, r.app_name, r.app_id, r.date, COALESCE(r.status, 'in_progress'), r.created_at,
+           CASE WHEN COALESCE(s.total, 0) = 0 THEN '—'
+                ELSE COALESCE(s.filled, 0) || '/' || s.total || ' (' || (100 * COALESCE(s.filled, 0) / s.total) || '%)'
+           END
+    FROM review r
+    LEFT JOIN review_summary s ON s.review_id = r.id
+    WHERE r.archived = ?
+    ORDER BY r.created_at DESC
+"""
+CHECKLIST_SECTIONS_SQL = (
+    "SELECT id, sort_order, name, COALESCE(is_default, 1) AS is_default FROM checklist_section ORDER BY sort_order, id"
+)
+CHECKLIST_ITEMS_SQL = "SELECT id, section_id, sort_order, text FROM checklist ORDER BY sort_order, id"
+# All checklist items with their section name ("General" when it has none or it is empty), in display order
+CHECKLIST_WITH_SECTION_SQL = """
+    SELECT c.id, c.text, c.section_id, COALESCE(NULLIF(s.name, ''), 'General') AS section_name
+    FROM checklist c
+    LEFT JOIN checklist_section s ON c.section_id = s.id
+    ORDER BY s.sort_order, s.id, c.sort_order, c.id
+"""
+
+# Every review column the run, detail and PDF views use, plus what building its checklist needs next (the
+# checklist version and the review's section ids, comma-separated), so a view costs one query before the results
+REVIEW_SQL = """
+    SELECT id, app_name, app_id, date, app_owner_email, store_url, overall_notes, status, archived, created_at,
+           revision, (SELECT version FROM checklist_version) AS checklist_version,
+           (SELECT group_concat(section_id) FROM review_section WHERE review_id = review.id) AS section_ids
+    FROM review WHERE id = ?
+"""
+# Per-item results of one review (bind: review_id)
+REVIEW_RESULTS_SQL = "SELECT checklist_id, result, attachment FROM review_result WHERE review_id = ?"
+CHECKLIST_VERSION_SQL = "SELECT version FROM checklist_version"
+# Trigger-maintained counter of changes the runs overview can show; keys the index() listing cache
+REVIEWS_VERSION_SQL = "SELECT version FROM reviews_version"
+
+# PDF download names: every character outside [A-Za-z0-9_.-] (spaces, path separators, quotes, control
+# characters, non-ASCII) becomes an underscore
+_FILENAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+# review_run form fields carrying a per-item value: result_<checklist id> / attachment_<checklist id>
+_ITEM_FIELD_RE = re.compile(r"(result|attachment)_(\d+)")
+
+# Part of every review page ETag, so a restart (e.g. a deploy with changed templates) invalidates cached pages
+_ETAG_SALT = uuid4().hex[:8]
+
+# (result, attachment) for an item with no review_result row
+_NO_RESULT = (None, "")
+
+# Review status -> label shown in the runs overview and on the review page
+_STATUS_DISPLAY = {
+    "in_progress": "In Review",
+    "completed": "Completed",
+    "approved": "Approved",
+    "rejected": "Rejected",
+}
+
+# Review actions shared by the single-review buttons and POST /reviews/bulk: action -> UPDATE (bind: review id)
+_REVIEW_ACTION_SQL = {
+    "approve": "UPDATE review SET status = 'approved' WHERE id = ?",
+    "reject": "UPDATE review SET status = 'rejected' WHERE id = ?",
+    "archive": "UPDATE review SET archived = 1 WHERE id = ?",
+    "unarchive": "UPDATE review SET archived = 0 WHERE id = ?",
+}
+
+def _apply_review_actions(db, actions):
+    """Apply (review_id, action) pairs in one transaction: one executemany per action, one commit for the batch.
+    When a review gets several status (approve/reject) or archive (archive/unarchive) actions, the last one wins.
+    Returns the number of review rows updated (ids that don't exist count for nothing)."""
+    # (review_id, sets status?) -> action; later pairs overwrite earlier ones for the same column
+    latest = {(review_id, action in ("approve", "reject")): action for review_id, action in actions}
+    by_action = {}
+    for (review_id, _), action in latest.items():
+        by_action.setdefault(action, []).append((review_id,))
+    updated = 0
+    with db:
+        for action, params in by_action.items():
+            updated += db.executemany(_REVIEW_ACTION_SQL[action], params).rowcount
+    return updated
+
+
+def _norm_header(c):
+    """CSV header name without surrounding whitespace or a stray BOM."""
+    return (c or "").strip().lstrip("\ufeff")
+
+
+CSV_READ_ERROR = "Could not read CSV. Use UTF-8 and columns: section_name, criteria"
+CSV_COLUMNS_ERROR = "CSV must have columns: section_name, criteria"
+CSV_IMPORT_FAILED = "CSV import failed because of a server error; nothing was imported."
+# Delimiter detection: characters considered and how much of the file is sampled
+CSV_DELIMITERS = ",;\t|"
+CSV_SNIFF_CHARS = 8192
+
+
+def _open_csv_reader(stream):
+    """Wrap a seekable binary CSV stream in a csv.reader positioned after the header row.
+    Returns (reader, section_idx, criteria_idx): the column indexes of section_name and criteria.
+
+    The delimiter (comma, semicolon, tab or pipe) is sniffed from the first CSV_SNIFF_CHARS characters, so
+    spreadsheet exports in other locales import too; quoting stays standard. Raises ValueError carrying the
+    message to show when the file can't be read or lacks the columns, before any data rows are parsed.
+    """
+    try:
+        text = TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+        sample = text.read(CSV_SNIFF_CHARS)
+        text.seek(0)
+        # Only whole lines, so a row cut off at the sample's end doesn't skew the guess
+        if len(sample) == CSV_SNIFF_CHARS and "\n" in sample:
+            sample = sample[: sample.rindex("\n")]
+        try:
+            delimiter = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS).delimiter
+        except csv.Error:
+            delimiter = ","
+        reader = csv.reader(text, delimiter=delimiter)
+        header = [_norm_header(k) for k in next(reader, [])]
+    except Exception:
+        raise ValueError(CSV_READ_ERROR)
+    if "section_name" not in header or "criteria" not in header:
+        raise ValueError(CSV_COLUMNS_ERROR)
+    return reader, header.index("section_name"), header.index("criteria")
+
+
+def _import_csv_rows(db, reader, section_idx, criteria_idx):
+    """Add the csv.reader's (section_name, criteria) rows to the checklist in one transaction.
+
+    Unknown sections are created; exact duplicates within a section are skipped. Returns the summary message.
+    """
+    sections_by_name = {
+        row["name"]: row["id"]
+        for row in db.execute(
+            "SELECT id, name FROM checklist_section"
+        ).fetchall()
+    }
+    max_section_order = db.execute(
+        "SELECT COALESCE(MAX(sort_order), -1) FROM checklist_section"
+    ).fetchone()[0] or -1
+    # Duplicate check and next sort_order come from these two preloads, not per-row queries
+    existing = {tuple(r) for r in db.execute("SELECT section_id, text FROM checklist")}
+    max_orders = dict(
+        db.execute("SELECT section_id, MAX(sort_order) FROM checklist GROUP BY section_id").fetchall()
+    )
+    to_insert = []
+    skipped = 0
+    # Criteria for sections that don't exist yet, by section name in first-seen order; the sections
+    # are created together after the pass so the whole import is a single transaction
+    new_section_items = {}
+    # Rows shorter than the header (including blank lines) lack the column; treat it as empty
+    for row in reader:
+        sec_name = row[section_idx].strip() if section_idx < len(row) else ""
+        criteria_text = row[criteria_idx].strip() if criteria_idx < len(row) else ""
+        if not sec_name or not criteria_text:
+            continue
+        sec_id = sections_by_name.get(sec_name)
+        if sec_id is None:
+            texts = new_section_items.setdefault(sec_name, {})
+            if criteria_text in texts:
+                skipped += 1
+            else:
+                texts[criteria_text] = None
+            continue
+        if (sec_id, criteria_text) in existing:
+            skipped += 1
+            continue
+        existing.add((sec_id, criteria_text))
+        max_orders[sec_id] = max_orders.get(sec_id, -1) + 1
+        to_insert.append((sec_id, max_orders[sec_id], criteria_text))
+    new_sections = len(new_section_items)
+    if new_section_items:
+        # Multi-row INSERT ... RETURNING hands back the new ids directly (SQLite 3.35+)
+        names = list(new_section_items)
+        new_ids = {}
+        for start in range(0, len(names), BULK_CHUNK_SIZE):
+            chunk = names[start:start + BULK_CHUNK_SIZE]
+            new_ids.update(
+                db.execute(
+                    "INSERT INTO checklist_section (sort_order, name) VALUES "
+                    + ", ".join(["(?, ?)"] * len(chunk))
+                    + " RETURNING name, id",
+                    [
+                        value
+                        for i, name in enumerate(chunk, start)
+                        for value in (max_section_order + 1 + i, name)
+                    ],
+                ).fetchall()
+            )
+        for name, texts in new_section_items.items():
+            to_insert.extend(
+                (new_ids[name], order, text) for order, text in enumerate(texts)
+            )
+    db.executemany(
+        "INSERT INTO checklist (section_id, sort_order, text) VALUES (?, ?, ?)",
+        to_insert,
+    )
+    added = len(to_insert)
+    db.commit()
+    msg = f"Imported {added} criteria."
+    if new_sections:
+        msg += f" Created {new_sections} new section(s)."
+    if skipped:
+        msg += f" Skipped {skipped} duplicate(s) (exact match in same section)."
+    return msg
+
+
+def _register_import_job(job_id):
+    """Record a new running import job, then drop the oldest finished jobs beyond IMPORT_JOBS_KEPT."""
+    with _import_jobs_lock:
+        _import_jobs[job_id] = {"status": "running", "message": ""}
+        excess = len(_import_jobs) - IMPORT_JOBS_KEPT
+        if excess > 0:
+            finished = [jid for jid, job in _import_jobs.items() if job["status"] != "running"]
+            for jid in finished[:excess]:
+                del _import_jobs[jid]
+
+
+def _run_csv_import_job(job_id, db_path, path):
+    """Background import of a spooled CSV upload on its own connection; records the outcome in _import_jobs."""
+    try:
+        with open(path, "rb") as fh:
+            try:
+                reader, section_idx, criteria_idx = _open_csv_reader(fh)
+            except ValueError as e:
+                job = {"status": "error", "message": str(e)}
+            else:
+                db = open_db(db_path)
+                try:
+                    job = {"status": "done", "message": _import_csv_rows(db, reader, section_idx, criteria_idx)}
+                finally:
+                    db.close()
+    except (csv.Error, UnicodeDecodeError):
+        # A malformed row past the header: bad input, and the import never committed
+        job = {"status": "error", "message": CSV_READ_ERROR}
+    except Exception:
+        # Database errors (e.g. "database is locked") and bugs are not the upload's fault; log them
+        _log.exception("Background CSV import %s failed", job_id)
+        job = {"status": "error", "message": CSV_IMPORT_FAILED}
+    finally:
+        os.unlink(path)
+    with _import_jobs_lock:
+        _import_jobs[job_id] = job
 
 
 def register_routes(app):
     """Register all routes on the Flask app."""
 
     def _get_review_section_ids(db, review_id):
-        """Return set of section_id for this review, or None meaning 'all sections' (backward compat)."""
-        rows = db.execute(
-            "SELECT section_id FROM review_section WHERE review_id = ?", (review_id,)
-        ).fetchall()
-        if not rows:
-            return None
-        return {row["section_id"] for row in rows}
+        """Return frozenset of section_id for this review, or None meaning 'all sections' (backward compat).
+
+        Memoized per request on g.review_section_ids; routes that rewrite review_section drop the entry.
+        """
+        cache = g.setdefault("review_section_ids", {})
+        if review_id not in cache:
+            ids = frozenset(
+                row[0]
+                for row in db.execute(
+                    "SELECT section_id FROM review_section WHERE review_id = ?", (review_id,)
+                )
+            )
+            cache[review_id] = ids or None
+        return cache[review_id]
 
     def _build_reviews_list(rows):
-        """Build list of review dicts with progress and status_display."""
-        status_display_map = {
-            "in_progress": "In Review",
-            "completed": "Completed",
-            "approved": "Approved",
-            "rejected": "Rejected",
-        }
+        """Build list of review dicts with status_display from INDEX_SQL tuples (progress comes formatted)."""
         reviews = []
-        for row in rows:
-            total = row["total"] or 0
-            filled = row["filled"] or 0
-            if total == 0:
-                progress = "—"
-            else:
-                pct = 100 * filled // total
-                progress = f"{filled}/{total} ({pct}%)"
-            status = row["status"] or "in_progress"
+        for review_id, app_name, app_id, date_val, status, created_at, progress in rows:
             reviews.append(
                 {
-                    "id": row["id"],
-                    "app_name": row["app_name"],
-                    "app_id": row["app_id"],
-                    "date": row["date"],
+                    "id": review_id,
+                    "app_name": app_name,
+                    "app_id": app_id,
+                    "date": date_val,
                     "status": status,
-                    "status_display": status_display_map.get(status, status),
-                    "created_at": row["created_at"],
+                    "status_display": _STATUS_DISPLAY.get(status, status),
+                    "created_at": created_at,
                     "progress": progress,
                 }
             )
         return reviews
 
-    @app.route("/")
-    def index():
-        """Runs overview: Active and Archived tabs."""
-        db = get_db()
-        tab = request.args.get("tab", "active")
-        base_sql = """
-            SELECT r.id, r.app_name, r.app_id, r.date, r.status, r.created_at,
-                   (SELECT COUNT(*) FROM review_result rr WHERE rr.review_id = r.id AND rr.result IS NOT NULL) AS filled,
-                   (SELECT COUNT(*) FROM review_result rr WHERE rr.review_id = r.id) AS total
-            FROM review r
-            WHERE r.archived = ?
-            ORDER BY r.created_at DESC
+    @lru_cache(maxsize=4)
+    def _load_reviews_list(version, db_path, archived):
+        """Review dicts for one index() tab; cached per reviews_version, which database triggers bump on every
+        change the overview can show (from any process).
+
+        version and db_path are only cache keys; the query runs on the request's connection.
         """
-        rows_active = db.execute(base_sql, (0,)).fetchall()
-        rows_archived = db.execute(base_sql, (1,)).fetchall()
-        reviews_active = _build_reviews_list(rows_active)
-        reviews_archived = _build_reviews_list(rows_archived)
-        return render_template(
-            "index.html",
-            reviews_active=reviews_active,
-            reviews_archived=reviews_archived,
-            tab=tab,
-            active_page="index",
+        return _build_reviews_list(iter_tuples(get_db(), INDEX_SQL, (archived,)))
+
+    @lru_cache(maxsize=64)
+    def _load_checklist_skeleton(version, db_path, section_ids):
+        """Checklist grouped by section as ((section_name, ((item_id, text), ...)), ...), limited to section_ids
+        (None = all). Cached per checklist_version, which database triggers bump on every checklist change.
+
+        version and db_path are only cache keys; the query runs on the request's connection.
+        """
+        rows = iter_tuples(get_db(), CHECKLIST_WITH_SECTION_SQL)
+        if section_ids is not None:
+            rows = (row for row in rows if row[2] in section_ids)
+        # Rows arrive in section order, so groupby's adjacent runs are exactly the sections
+        return tuple(
+            (name, tuple((item_id, text) for item_id, text, _, _ in group))
+            for name, group in groupby(rows, key=itemgetter(3))
+        )
+
+    def _load_review(db, review_id):
+        """The review's REVIEW_SQL row (sqlite3.Row, read by key), or abort with 404. Seeds the request's
+        checklist version and the _get_review_section_ids memo from the same row."""
+        review = db.execute(REVIEW_SQL, (review_id,)).fetchone()
+        if not review:
+            abort(404)
+        g.checklist_version = review["checklist_version"]
+        section_ids = review["section_ids"]
+        g.setdefault("review_section_ids", {})[review_id] = (
+            frozenset(map(int, section_ids.split(","))) if section_ids else None
         )
+        return review
+
+    def _conditional_response(etag, render):
+        """render()'s response, or an empty 304 when the client's If-None-Match already has etag.
+
+        Callers build etag from version counters they already hold, so a match costs no further queries and
+        render() only runs on a miss. Pending flash messages always force a full render so they are shown.
+        """
+        if etag in request.if_none_match and not session.get("_flashes"):
+            response = make_response("", 304)
+        else:
+            response = make_response(render())
+        response.set_etag(etag)
+        # Revalidate on every visit instead of reusing the page heuristically
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def _review_etag(review, page):
+        """ETag for one view of a review: its revision (bumped by database triggers when the review, its results
+        or its sections change) plus the checklist version; needs _load_review to have run."""
+        return f"{_ETAG_SALT}-{page}-{review['id']}-{review['revision']}-{g.checklist_version}"
+
+    def _review_skeleton_results(db, review_id):
+        """(checklist skeleton, {checklist_id: (result, stripped attachment)}) for the review's sections: the
+        cached skeleton plus one review_result query."""
+        version = g.get("checklist_version")
+        if version is None:
+            version = db.execute(CHECKLIST_VERSION_SQL).fetchone()[0]
+        skeleton = _load_checklist_skeleton(version, g.db_path, _get_review_section_ids(db, review_id))
+        # checklist_id -> (result, stripped attachment): one probe per item
+        results = {
+            checklist_id: (result, attachment.strip() if attachment else "")
+            for checklist_id, result, attachment in iter_tuples(db, REVIEW_RESULTS_SQL, (review_id,))
+        }
+        return skeleton, results
+
+    def _review_sections_criteria(db, review_id):
+        """[{"name", "items": [{"id", "text", "result", "attachment"}]}] for the review's sections (PDF export)."""
+        skeleton, results = _review_skeleton_results(db, review_id)
+        sections_criteria = []
+        for sec_name, items in skeleton:
+            sec_items = []
+            for item_id, text in items:
+                result, attachment = results.get(item_id, _NO_RESULT)
+                sec_items.append({"id": item_id, "text": text, "result": result, "attachment": attachment})
+            sections_criteria.append({"name": sec_name, "items": sec_items})
+        return sections_criteria
+
+    def _review_sections_lazy(db, review_id):
+        """[(section name, iterator of (id, text, result, attachment))] for the review page templates.
+
+        Each section's rows are produced while the template walks them, so no per-item dicts or lists are
+        built; the outer list stays a list so templates can still test it for emptiness. Iterate once.
+        """
+        skeleton, results = _review_skeleton_results(db, review_id)
+        return [
+            (sec_name, ((item_id, text, *results.get(item_id, _NO_RESULT)) for item_id, text in items))
+            for sec_name, items in skeleton
+        ]
+
+    @app.route("/")
+    def index():
+        """Runs overview: Active and Archived tabs. Only the requested tab is loaded; tabs are separate pages."""
+        # Anything but "active" shows the archived tab, as before; normalized since tab goes into the ETag
+        tab = "active" if request.args.get("tab", "active") == "active" else "archived"
+        archived = 0 if tab == "active" else 1
+        # Opening the request connection also sets g.db_path, part of the cache key
+        version = get_db().execute(REVIEWS_VERSION_SQL).fetchone()[0]
+
+        def render():
+            reviews = _load_reviews_list(version, g.db_path, archived)
+            return render_template(
+                "index.html",
+                reviews_active=[] if archived else reviews,
+                reviews_archived=reviews if archived else [],
+                tab=tab,
+                active_page="index",
+            )
+
+        # The listing only changes when the database's reviews_version does, whichever process or connection
+        # wrote, so the ETag is built from it like the review pages' revision / checklist_version ETags
+        return _conditional_response(f"{_ETAG_SALT}-index-{tab}-{version}", render)
 
     @app.route("/bulk-archive", methods=["POST"])
     def bulk_archive():
@@ -91,10 +454,11 @@ def register_routes(app):
         review_ids = request.form.getlist("review_ids", type=int)
         if review_ids:
             db = get_db()
-            placeholders = ",".join("?" * len(review_ids))
+            # Ids bound as one JSON array: the statement text (and its prepared statement) is the same for any
+            # number of selected reviews
             db.execute(
-                f"UPDATE review SET archived = 1 WHERE id IN ({placeholders})",
-                review_ids,
+                "UPDATE review SET archived = 1 WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(review_ids),),
             )
             db.commit()
             flash(f"Archived {len(review_ids)} review(s).")
@@ -106,10 +470,9 @@ def register_routes(app):
         review_ids = request.form.getlist("review_ids", type=int)
         if review_ids:
             db = get_db()
-            placeholders = ",".join("?" * len(review_ids))
             db.execute(
-                f"UPDATE review SET archived = 0 WHERE id IN ({placeholders})",
-                review_ids,
+                "UPDATE review SET archived = 0 WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(review_ids),),
             )
             db.commit()
             flash(f"Unarchived {len(review_ids)} review(s).")
@@ -121,10 +484,9 @@ def register_routes(app):
         review_ids = request.form.getlist("review_ids", type=int)
         if review_ids:
             db = get_db()
-            placeholders = ",".join("?" * len(review_ids))
             cur = db.execute(
-                f"DELETE FROM review WHERE id IN ({placeholders}) AND archived = 1",
-                review_ids,
+                "DELETE FROM review WHERE id IN (SELECT value FROM json_each(?)) AND archived = 1",
+                (json.dumps(review_ids),),
             )
             db.commit()
             deleted = cur.rowcount
@@ -132,6 +494,28 @@ def register_routes(app):
                 flash(f"Permanently deleted {deleted} review(s).")
         return redirect(url_for("index", tab="archived"))
 
+    @app.route("/reviews/bulk", methods=["POST"])
+    def reviews_bulk():
+        """Apply several review actions in one request and one transaction.
+
+        JSON body: [{"id": <review id>, "action": "approve" | "reject" | "archive" | "unarchive"}, ...].
+        Responds {"updated": <number of review rows changed>}, so unknown ids don't count; 400 if any entry is
+        malformed (nothing is applied).
+        """
+        entries = request.get_json(silent=True)
+        if not isinstance(entries, list):
+            abort(400)
+        actions = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                abort(400)
+            review_id, action = entry.get("id"), entry.get("action")
+            if type(review_id) is not int or action not in _REVIEW_ACTION_SQL:
+                abort(400)
+            actions.append((review_id, action))
+        updated = _apply_review_actions(get_db(), actions) if actions else 0
+        return jsonify({"updated": updated})
+
     @app.route("/checklist", methods=["GET", "POST"])
     def checklist_edit():
         """View/edit checklist: sections and items. Paste into section, add/rename/remove sections, add/remove/reorder items."""
@@ -147,11 +531,10 @@ def register_routes(app):
                         "SELECT COALESCE(MAX(sort_order), -1) FROM checklist WHERE section_id = ?",
                         (section_id,),
                     ).fetchone()[0] or -1
-                    for i, line in enumerate(lines):
-                        db.execute(
-                            "INSERT INTO checklist (section_id, sort_order, text) VALUES (?, ?, ?)",
-                            (section_id, max_order + 1 + i, line),
-                        )
+                    db.executemany(
+                        "INSERT INTO checklist (section_id, sort_order, text) VALUES (?, ?, ?)",
+                        [(section_id, max_order + 1 + i, line) for i, line in enumerate(lines)],
+                    )
                     db.commit()
                     flash("Items added to section from pasted text.")
                 return redirect(url_for("checklist_edit"))
@@ -160,74 +543,28 @@ def register_routes(app):
                 if not f or not f.filename or not f.filename.lower().endswith((".csv", ".txt")):
                     flash("Please upload a CSV file.")
                     return redirect(url_for("checklist_edit"))
+                if (request.content_length or 0) > CSV_ASYNC_MIN_BYTES:
+                    # Large upload: spool it to disk and import on the background worker; the response returns now
+                    with NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+                        f.save(tmp)
+                    job_id = uuid4().hex
+                    _register_import_job(job_id)
+                    _import_executor.submit(_run_csv_import_job, job_id, g.db_path, tmp.name)
+                    session["csv_import_jobs"] = session.get("csv_import_jobs", []) + [job_id]
+                    flash("Large CSV is importing in the background; the result will show here when it finishes.")
+                    return redirect(url_for("checklist_edit"))
                 try:
-                    raw = f.read()
-                    text = raw.decode("utf-8-sig", errors="replace")
-                    reader = csv.DictReader(StringIO(text))
-                    fieldnames = list(reader.fieldnames or [])
-                    norm = lambda c: (c or "").strip().lstrip("\ufeff")
-                    normalized = [norm(k) for k in fieldnames]
-                    if "section_name" not in normalized or "criteria" not in normalized:
-                        flash("CSV must have columns: section_name, criteria")
-                        return redirect(url_for("checklist_edit"))
-                    section_key = next(k for k in fieldnames if norm(k) == "section_name")
-                    criteria_key = next(k for k in fieldnames if norm(k) == "criteria")
-                except Exception:
-                    flash("Could not read CSV. Use UTF-8 and columns: section_name, criteria")
+                    # Stream the upload row by row instead of reading and decoding the whole file up front
+                    reader, section_idx, criteria_idx = _open_csv_reader(f.stream)
+                except ValueError as e:
+                    flash(str(e))
                     return redirect(url_for("checklist_edit"))
-                db = get_db()
-                sections_by_name = {
-                    row["name"]: row["id"]
-                    for row in db.execute(
-                        "SELECT id, name FROM checklist_section"
-                    ).fetchall()
-                }
-                max_section_order = db.execute(
-                    "SELECT COALESCE(MAX(sort_order), -1) FROM checklist_section"
-                ).fetchone()[0] or -1
-                added = 0
-                skipped = 0
-                new_sections = 0
-                for row in reader:
-                    sec_name = (row.get(section_key) or "").strip()
-                    criteria_text = (row.get(criteria_key) or "").strip()
-                    if not sec_name or not criteria_text:
-                        continue
-                    if sec_name not in sections_by_name:
-                        max_section_order += 1
-                        cur = db.execute(
-                            "INSERT INTO checklist_section (sort_order, name) VALUES (?, ?)",
-                            (max_section_order, sec_name),
-                        )
-                        db.commit()
-                        sec_id = cur.lastrowid
-                        sections_by_name[sec_name] = sec_id
-                        new_sections += 1
-                    else:
-                        sec_id = sections_by_name[sec_name]
-                    exists = db.execute(
-                        "SELECT 1 FROM checklist WHERE section_id = ? AND text = ?",
-                        (sec_id, criteria_text),
-                    ).fetchone()
-                    if exists:
-                        skipped += 1
-                        continue
-                    max_order = db.execute(
-                        "SELECT COALESCE(MAX(sort_order), -1) FROM checklist WHERE section_id = ?",
-                        (sec_id,),
-                    ).fetchone()[0] or -1
-                    db.execute(
-                        "INSERT INTO checklist (section_id, sort_order, text) VALUES (?, ?, ?)",
-                        (sec_id, max_order + 1, criteria_text),
-                    )
-                    added += 1
-                db.commit()
-                msg = f"Imported {added} criteria."
-                if new_sections:
-                    msg += f" Created {new_sections} new section(s)."
-                if skipped:
-                    msg += f" Skipped {skipped} duplicate(s) (exact match in same section)."
-                flash(msg)
+                try:
+                    flash(_import_csv_rows(db, reader, section_idx, criteria_idx))
+                except (csv.Error, UnicodeDecodeError):
+                    # Malformed row past the header; nothing was written yet
+                    db.rollback()
+                    flash(CSV_READ_ERROR)
                 return redirect(url_for("checklist_edit"))
             if action == "add_section":
                 name = request.form.get("section_name", "").strip() or "Section"
@@ -255,15 +592,7 @@ def register_routes(app):
             if action == "delete_section":
                 section_id = request.form.get("section_id", type=int)
                 if section_id:
-                    first = db.execute(
-                        "SELECT id FROM checklist_section WHERE id != ? ORDER BY sort_order, id LIMIT 1",
-                        (section_id,),
-                    ).fetchone()
-                    if first:
-                        db.execute(
-                            "UPDATE checklist SET section_id = ? WHERE section_id = ?",
-                            (first["id"], section_id),
-                        )
+                    # The trg_checklist_section_delete_reassign trigger moves the items to the first other section
                     db.execute("DELETE FROM checklist_section WHERE id = ?", (section_id,))
                     db.commit()
                     flash("Section removed. Items moved to another section.")
@@ -357,12 +686,13 @@ def register_routes(app):
                     [k for k in request.form if k.startswith("order_")],
                     key=lambda x: int(x.split("_")[1]),
                 )
-                for i, key in enumerate(order_keys):
-                    cid = request.form.get(key, type=int)
-                    if cid:
-                        db.execute(
-                            "UPDATE checklist SET sort_order = ? WHERE id = ?", (i, cid)
-                        )
+                # Item ids in their new order (null where a field isn't a number); one UPDATE joins the JSON array
+                # so each item's sort_order becomes its array index
+                order_ids = json.dumps([request.form.get(key, type=int) for key in order_keys])
+                db.execute(
+                    "UPDATE checklist SET sort_order = o.key FROM json_each(?) AS o WHERE checklist.id = o.value",
+                    (order_ids,),
+                )
                 db.commit()
                 flash("Order updated.")
                 return redirect(url_for("checklist_edit"))
@@ -393,19 +723,26 @@ def register_routes(app):
                     flash("Default section setting updated.")
                 return redirect(url_for("checklist_edit"))
 
-        sections = db.execute(
-            "SELECT id, sort_order, name, COALESCE(is_default, 1) AS is_default FROM checklist_section ORDER BY sort_order, id"
-        ).fetchall()
-        items = db.execute(
-            "SELECT id, section_id, sort_order, text FROM checklist ORDER BY sort_order, id"
-        ).fetchall()
-        # Group items by section for template
+        sections = db.execute(CHECKLIST_SECTIONS_SQL).fetchall()
+        # Bucket (id, section_id, sort_order, text) tuples by section in one pass (sort order kept per bucket)
+        items_by_section = {}
+        for i in iter_tuples(db, CHECKLIST_ITEMS_SQL):
+            items_by_section.setdefault(i[1], []).append(i)
+        # Group items by section for template; each item dict is built once, with its order_index
         sections_with_items = []
         order_index = 0
         for sec in sections:
-            sec_items = [dict(i) for i in items if i["section_id"] == sec["id"]]
-            for it in sec_items:
-                it["order_index"] = order_index
+            sec_items = []
+            for item_id, section_id, sort_order, text in items_by_section.get(sec["id"], ()):
+                sec_items.append(
+                    {
+                        "id": item_id,
+                        "section_id": section_id,
+                        "sort_order": sort_order,
+                        "text": text,
+                        "order_index": order_index,
+                    }
+                )
                 order_index += 1
             sections_with_items.append(
                 {
@@ -416,12 +753,37 @@ def register_routes(app):
                     "items": sec_items,
                 }
             )
+        # Background CSV imports started from this session: flash finished ones, keep polling the rest. Jobs this
+        # process doesn't know (evicted, or started before a restart) are dropped.
+        pending_imports = []
+        job_ids = session.get("csv_import_jobs")
+        if job_ids:
+            with _import_jobs_lock:
+                jobs = [(job_id, _import_jobs.get(job_id)) for job_id in job_ids]
+            for job_id, job in jobs:
+                if job is None:
+                    continue
+                if job["status"] == "running":
+                    pending_imports.append(job_id)
+                else:
+                    flash(job["message"])
+            session["csv_import_jobs"] = pending_imports
         return render_template(
             "checklist_edit.html",
             sections=sections_with_items,
+            import_status_urls=[url_for("checklist_import_status", job_id=job_id) for job_id in pending_imports],
             active_page="checklist_edit",
         )
 
+    @app.route("/checklist/import/<job_id>")
+    def checklist_import_status(job_id):
+        """Status of a background CSV import as JSON: {"status": "running" | "done" | "error", "message": ...}."""
+        with _import_jobs_lock:
+            job = _import_jobs.get(job_id)
+        if job is None:
+            abort(404)
+        return jsonify(job)
+
     @app.route("/review/new", methods=["GET", "POST"])
     def review_new():
         """New review: step 1 = app metadata, step 2 = select sections. GET ?from_id=N pre-fills from review N (re-review)."""
@@ -531,38 +893,24 @@ def register_routes(app):
                        VALUES (?, ?, ?, ?, ?, ?, 'in_progress')""",
                     (app_name, app_id, date_val, app_owner_email, store_url_create, overall_notes),
                 )
-                db.commit()
                 review_id = cur.lastrowid
-                for sid in section_ids:
-                    db.execute(
-                        "INSERT INTO review_section (review_id, section_id) VALUES (?, ?)",
-                        (review_id, sid),
-                    )
-                db.commit()
+                db.executemany(
+                    "INSERT INTO review_section (review_id, section_id) VALUES (?, ?)",
+                    [(review_id, sid) for sid in section_ids],
+                )
+                # One blank result row per item in the selected sections. Re-review: the LEFT JOIN copies result and
+                # attachment from the original review for matching checklist items only; new sections/items (not in
+                # the original) have no source row, so they stay blank. Without from_id the join matches nothing.
                 placeholders = ",".join("?" * len(section_ids))
-                items = db.execute(
-                    "SELECT id FROM checklist WHERE section_id IN ({}) ORDER BY sort_order, id".format(
-                        placeholders
-                    ),
-                    section_ids,
-                ).fetchall()
-                for item in items:
-                    db.execute(
-                        "INSERT OR IGNORE INTO review_result (review_id, checklist_id) VALUES (?, ?)",
-                        (review_id, item["id"]),
-                    )
-                # Re-review: copy result and attachment from original review for matching checklist items only.
-                # New sections/items (not in original) have no source row, so they stay blank.
-                if from_id:
-                    for row in db.execute(
-                        "SELECT checklist_id, result, attachment FROM review_result WHERE review_id = ?",
-                        (from_id,),
-                    ).fetchall():
-                        db.execute(
-                            """UPDATE review_result SET result = ?, attachment = ?
-                               WHERE review_id = ? AND checklist_id = ?""",
-                            (row["result"], row["attachment"] or None, review_id, row["checklist_id"]),
-                        )
+                db.execute(
+                    f"""INSERT OR IGNORE INTO review_result (review_id, checklist_id, result, attachment)
+                        SELECT ?, c.id, src.result, NULLIF(src.attachment, '')
+                        FROM checklist c
+                        LEFT JOIN review_result src ON src.review_id = ? AND src.checklist_id = c.id
+                        WHERE c.section_id IN ({placeholders})
+                        ORDER BY c.sort_order, c.id""",
+                    [review_id, from_id] + section_ids,
+                )
                 db.commit()
                 return redirect(url_for("review_run", review_id=review_id))
 
@@ -581,12 +929,7 @@ def register_routes(app):
     def review_run(review_id):
         """Run checklist for a review: Pass/Fail/Partial/NA per item. Save / Finish review."""
         db = get_db()
-        review = db.execute(
-            "SELECT id, app_name, app_id, date, app_owner_email, store_url, overall_notes, status FROM review WHERE id = ?",
-            (review_id,),
-        ).fetchone()
-        if not review:
-            abort(404)
+        review = _load_review(db, review_id)
 
         if request.method == "POST":
             action = request.form.get("action")
@@ -598,139 +941,63 @@ def register_routes(app):
                 "UPDATE review SET store_url = ?, app_owner_email = ?, overall_notes = ? WHERE id = ?",
                 (store_url, app_owner_email, overall_notes, review_id),
             )
-            db.commit()
-            for key, val in request.form.items():
-                if key.startswith("result_") and val in RESULTS:
-                    cid = key[7:]
-                    if cid.isdigit():
-                        attachment_val = request.form.get(f"attachment_{cid}", "").strip() or None
-                        db.execute(
-                            """INSERT INTO review_result (review_id, checklist_id, result, attachment)
-                               VALUES (?, ?, ?, ?) ON CONFLICT(review_id, checklist_id) DO UPDATE SET result = excluded.result, attachment = excluded.attachment""",
-                            (review_id, int(cid), val, attachment_val),
-                        )
+            if action == "finish":
+                db.execute("UPDATE review SET status = 'completed' WHERE id = ?", (review_id,))
+            # One pass over the form; the header (and finish status) UPDATEs above commit with the results below
+            results = {}
+            attachments = {}
             for key, val in request.form.items():
-                if key.startswith("attachment_"):
-                    cid = key[11:]
-                    if cid.isdigit():
-                        checklist_id = int(cid)
-                        attachment_val = val.strip() or None
-                        db.execute(
-                            """INSERT INTO review_result (review_id, checklist_id, attachment)
-                               VALUES (?, ?, ?) ON CONFLICT(review_id, checklist_id) DO UPDATE SET attachment = excluded.attachment""",
-                            (review_id, checklist_id, attachment_val),
-                        )
-            db.commit()
+                # One compiled match per key; header fields don't match, invalid results are dropped
+                m = _ITEM_FIELD_RE.fullmatch(key)
+                if m is None:
+                    continue
+                field, cid = m.groups()
+                if field == "result":
+                    if val in RESULTS_SET:
+                        results[int(cid)] = val
+                else:
+                    attachments[int(cid)] = val.strip() or None
+            # checklist_id -> (result, attachment); a None result leaves the stored result unchanged
+            updates = {
+                cid: (results.get(cid), attachments.get(cid))
+                for cid in results.keys() | attachments.keys()
+            }
+            bulk_upsert_results(
+                db, review_id, [(cid, result, attachment) for cid, (result, attachment) in updates.items()]
+            )
 
             if action == "finish":
-                db.execute(
-                    "UPDATE review SET status = 'completed' WHERE id = ?", (review_id,)
-                )
-                db.commit()
                 flash("Review completed. You can export a PDF or re-review this app.")
                 return redirect(url_for("review_detail", review_id=review_id))
             # save and continue later
             flash("Progress saved.")
             return redirect(url_for("review_run", review_id=review_id))
 
-        items = db.execute(
-            """SELECT c.id, c.sort_order, c.text, c.section_id, s.name AS section_name, s.sort_order AS section_order
-               FROM checklist c
-               LEFT JOIN checklist_section s ON c.section_id = s.id
-               ORDER BY s.sort_order, s.id, c.sort_order, c.id"""
-        ).fetchall()
-        section_ids = _get_review_section_ids(db, review_id)
-        if section_ids is not None:
-            items = [row for row in items if row["section_id"] in section_ids]
-        result_map = {}
-        attachment_map = {}
-        for row in db.execute(
-            "SELECT checklist_id, result, attachment FROM review_result WHERE review_id = ?",
-            (review_id,),
-        ).fetchall():
-            result_map[row["checklist_id"]] = row["result"]
-            attachment_map[row["checklist_id"]] = (row["attachment"] or "").strip()
-
-        # Group by section
-        sections_criteria = []
-        current_sec = None
-        for row in items:
-            sec_name = row["section_name"] or "General"
-            if current_sec is None or current_sec["name"] != sec_name:
-                current_sec = {"name": sec_name, "items": []}
-                sections_criteria.append(current_sec)
-            current_sec["items"].append(
-                {
-                    "id": row["id"],
-                    "text": row["text"],
-                    "result": result_map.get(row["id"]),
-                    "attachment": attachment_map.get(row["id"], ""),
-                }
-            )
-        return render_template(
-            "review_run.html",
-            review=dict(review),
-            sections_criteria=sections_criteria,
-            results_options=RESULTS,
-            active_page="index",
+        return _conditional_response(
+            _review_etag(review, "run"),
+            lambda: render_template(
+                "review_run.html",
+                review=review,
+                sections_criteria=_review_sections_lazy(db, review_id),
+                results_options=RESULTS,
+                active_page="index",
+            ),
         )
 
     @app.route("/review/<int:review_id>")
     def review_detail(review_id):
         """Review detail: metadata, results, Export PDF, Re-review, Approve/Reject, Archive."""
         db = get_db()
-        review = db.execute(
-            "SELECT id, app_name, app_id, date, app_owner_email, store_url, overall_notes, status, archived, created_at FROM review WHERE id = ?",
-            (review_id,),
-        ).fetchone()
-        if not review:
-            abort(404)
-        review = dict(review)
-        status_display_map = {
-            "in_progress": "In Review",
-            "completed": "Completed",
-            "approved": "Approved",
-            "rejected": "Rejected",
-        }
-        review["status_display"] = status_display_map.get(review["status"], review["status"])
-
-        items = db.execute(
-            """SELECT c.id, c.sort_order, c.text, c.section_id, s.name AS section_name, s.sort_order AS section_order
-               FROM checklist c
-               LEFT JOIN checklist_section s ON c.section_id = s.id
-               ORDER BY s.sort_order, s.id, c.sort_order, c.id"""
-        ).fetchall()
-        section_ids = _get_review_section_ids(db, review_id)
-        if section_ids is not None:
-            items = [row for row in items if row["section_id"] in section_ids]
-        result_map = {}
-        attachment_map = {}
-        for row in db.execute(
-            "SELECT checklist_id, result, attachment FROM review_result WHERE review_id = ?",
-            (review_id,),
-        ).fetchall():
-            result_map[row["checklist_id"]] = row["result"]
-            attachment_map[row["checklist_id"]] = (row["attachment"] or "").strip()
-        sections_criteria = []
-        current_sec = None
-        for row in items:
-            sec_name = row["section_name"] or "General"
-            if current_sec is None or current_sec["name"] != sec_name:
-                current_sec = {"name": sec_name, "items": []}
-                sections_criteria.append(current_sec)
-            current_sec["items"].append(
-                {
-                    "id": row["id"],
-                    "text": row["text"],
-                    "result": result_map.get(row["id"]),
-                    "attachment": attachment_map.get(row["id"], ""),
-                }
-            )
-        return render_template(
-            "review_detail.html",
-            review=review,
-            sections_criteria=sections_criteria,
-            active_page="index",
+        review = _load_review(db, review_id)
+        return _conditional_response(
+            _review_etag(review, "detail"),
+            lambda: render_template(
+                "review_detail.html",
+                review=review,
+                status_display=_STATUS_DISPLAY.get(review["status"], review["status"]),
+                sections_criteria=_review_sections_lazy(db, review_id),
+                active_page="index",
+            ),
         )
 
     @app.route("/review/<int:review_id>/edit-sections", methods=["GET", "POST"])
@@ -762,28 +1029,21 @@ def register_routes(app):
                     sections=sections_for_form,
                     active_page="index",
                 )
-            # Replace review_section for this review
-            db.execute("DELETE FROM review_section WHERE review_id = ?", (review_id,))
-            for sid in section_ids:
-                db.execute(
+            # Replace review_section for this review and ensure review_result rows exist for all checklist items
+            # in the selected sections: set-based statements, one commit
+            placeholders = ",".join("?" * len(section_ids))
+            with db:
+                db.execute("DELETE FROM review_section WHERE review_id = ?", (review_id,))
+                db.executemany(
                     "INSERT INTO review_section (review_id, section_id) VALUES (?, ?)",
-                    (review_id, sid),
+                    [(review_id, sid) for sid in section_ids],
                 )
-            db.commit()
-            # Ensure review_result rows exist for all checklist items in selected sections
-            placeholders = ",".join("?" * len(section_ids))
-            items = db.execute(
-                "SELECT id FROM checklist WHERE section_id IN ({}) ORDER BY sort_order, id".format(
-                    placeholders
-                ),
-                section_ids,
-            ).fetchall()
-            for item in items:
                 db.execute(
-                    "INSERT OR IGNORE INTO review_result (review_id, checklist_id) VALUES (?, ?)",
-                    (review_id, item["id"]),
+                    "INSERT OR IGNORE INTO review_result (review_id, checklist_id)"
+                    f" SELECT ?, id FROM checklist WHERE section_id IN ({placeholders})",
+                    (review_id, *section_ids),
                 )
-            db.commit()
+            g.get("review_section_ids", {}).pop(review_id, None)
             flash("Sections updated. You can add or remove sections anytime from the checklist.")
             return redirect(url_for("review_run", review_id=review_id))
 
@@ -816,89 +1076,54 @@ def register_routes(app):
     @app.route("/review/<int:review_id>/approve", methods=["POST"])
     def approve(review_id):
         """Mark review as approved (decision only; does not archive)."""
-        db = get_db()
-        db.execute("UPDATE review SET status = 'approved' WHERE id = ?", (review_id,))
-        db.commit()
+        _apply_review_actions(get_db(), [(review_id, "approve")])
         flash("Review approved.")
         return redirect(url_for("review_detail", review_id=review_id))
 
     @app.route("/review/<int:review_id>/reject", methods=["POST"])
     def reject(review_id):
         """Mark review as rejected."""
-        db = get_db()
-        db.execute("UPDATE review SET status = 'rejected' WHERE id = ?", (review_id,))
-        db.commit()
+        _apply_review_actions(get_db(), [(review_id, "reject")])
         flash("Review rejected.")
         return redirect(url_for("review_detail", review_id=review_id))
 
     @app.route("/review/<int:review_id>/archive", methods=["POST"])
     def archive(review_id):
         """Move review to Archived (archived=1)."""
-        db = get_db()
-        db.execute("UPDATE review SET archived = 1 WHERE id = ?", (review_id,))
-        db.commit()
+        _apply_review_actions(get_db(), [(review_id, "archive")])
         flash("Review archived.")
         return redirect(url_for("index", tab="archived"))
 
     @app.route("/review/<int:review_id>/unarchive", methods=["POST"])
     def unarchive(review_id):
         """Move review back to Active (archived=0)."""
-        db = get_db()
-        db.execute("UPDATE review SET archived = 0 WHERE id = ?", (review_id,))
-        db.commit()
+        _apply_review_actions(get_db(), [(review_id, "unarchive")])
         flash("Review unarchived.")
         return redirect(url_for("review_detail", review_id=review_id))
 
     @app.route("/review/<int:review_id>/pdf")
     def pdf_export(review_id):
-        """Generate and download PDF report for the review."""
-        from pdf_report import build_pdf
-
+        """Generate and download PDF report for the review; 304 (no PDF built) when the client's copy is current."""
         db = get_db()
-        review = db.execute(
-            "SELECT id, app_name, app_id, date, app_owner_email, store_url, overall_notes, created_at FROM review WHERE id = ?",
-            (review_id,),
-        ).fetchone()
-        if not review:
-            abort(404)
-        review = dict(review)
-        items = db.execute(
-            """SELECT c.id, c.sort_order, c.text, c.section_id, s.name AS section_name, s.sort_order AS section_order
-               FROM checklist c
-               LEFT JOIN checklist_section s ON c.section_id = s.id
-               ORDER BY s.sort_order, s.id, c.sort_order, c.id"""
-        ).fetchall()
-        section_ids = _get_review_section_ids(db, review_id)
-        if section_ids is not None:
-            items = [row for row in items if row["section_id"] in section_ids]
-        result_map = {}
-        attachment_map = {}
-        for row in db.execute(
-            "SELECT checklist_id, result, attachment FROM review_result WHERE review_id = ?",
-            (review_id,),
-        ).fetchall():
-            result_map[row["checklist_id"]] = row["result"]
-            attachment_map[row["checklist_id"]] = (row["attachment"] or "").strip()
-        sections_criteria = []
-        current_sec = None
-        for row in items:
-            sec_name = row["section_name"] or "General"
-            if current_sec is None or current_sec["name"] != sec_name:
-                current_sec = {"name": sec_name, "items": []}
-                sections_criteria.append(current_sec)
-            current_sec["items"].append(
-                {
-                    "text": row["text"],
-                    "result": result_map.get(row["id"]),
-                    "attachment": attachment_map.get(row["id"], ""),
-                }
+        review = _load_review(db, review_id)
+
+        def render():
+            pdf_file = SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+            # build_pdf reads optional fields with .get(), which sqlite3.Row lacks
+            build_pdf(dict(review), _review_sections_criteria(db, review_id), out=pdf_file)
+            pdf_file.seek(0)
+            filename = _FILENAME_UNSAFE_RE.sub("_", f"UAT_Report_{review['app_name']}_{review['app_id']}.pdf")
+            # send_file streams the file object in blocks and closes it when the response is done
+            return send_file(
+                pdf_file,
+                mimetype="application/pdf",
+                as_attachment=True,
+                download_name=filename,
             )
-        buf = build_pdf(review, sections_criteria)
-        buf.seek(0)
-        filename = f"UAT_Report_{review['app_name'].replace(' ', '_')}_{review['app_id']}.pdf"
-        return send_file(
-            buf,
-            mimetype="application/pdf",
-            as_attachment=True,
-            download_name=filename,
-        )
+
+        return _conditional_response(_review_etag(review, "pdf"), render)
+
+    # Compile every template now so the first request to each page doesn't pay the parse; Jinja keeps the
+    # compiled templates in its cache (reloaded only when TEMPLATES_AUTO_RELOAD / debug is on)
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
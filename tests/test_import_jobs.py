@@ -0,0 +1,50 @@
+"""Eviction of background CSV import jobs (routes._register_import_job)."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import routes  # noqa: E402
+
+
+class RegisterImportJobTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(routes._import_jobs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fill(self, finished, running):
+        for i in range(finished):
+            routes._import_jobs[f"done{i}"] = {"status": "done", "message": ""}
+        for i in range(running):
+            routes._import_jobs[f"run{i}"] = {"status": "running", "message": ""}
+
+    def test_under_cap_keeps_every_job(self):
+        self._fill(finished=58, running=1)
+        routes._register_import_job("new")
+        self.assertEqual(len(routes._import_jobs), 60)
+
+    def test_at_cap_keeps_every_job(self):
+        self._fill(finished=routes.IMPORT_JOBS_KEPT - 1, running=0)
+        routes._register_import_job("new")
+        self.assertEqual(len(routes._import_jobs), routes.IMPORT_JOBS_KEPT)
+
+    def test_over_cap_drops_oldest_finished_only(self):
+        self._fill(finished=routes.IMPORT_JOBS_KEPT, running=5)
+        routes._register_import_job("new")
+        self.assertEqual(len(routes._import_jobs), routes.IMPORT_JOBS_KEPT)
+        self.assertNotIn("done0", routes._import_jobs)
+        self.assertIn(f"done{routes.IMPORT_JOBS_KEPT - 1}", routes._import_jobs)
+        self.assertTrue(all(f"run{i}" in routes._import_jobs for i in range(5)))
+        self.assertEqual(routes._import_jobs["new"]["status"], "running")
+
+    def test_all_running_are_never_dropped(self):
+        self._fill(finished=0, running=routes.IMPORT_JOBS_KEPT + 3)
+        routes._register_import_job("new")
+        self.assertEqual(len(routes._import_jobs), routes.IMPORT_JOBS_KEPT + 4)
+
+
+if __name__ == "__main__":
+    unittest.main()